@@ -1,8 +1,10 @@
 from __future__ import annotations
  
 import random
-from collections import Counter, defaultdict
-from typing import Sequence
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Sequence
  
 from game.bots.base import (
     Action,
@@ -25,6 +27,49 @@ NOPE = "NopeCard"
 DEFUSE = "DefuseCard"
 EXPLODING = "ExplodingKittenCard"
  
+# Event types react() checks, bound once so the comparison is a single global load
+_EV_CARD_PLAYED = EventType.CARD_PLAYED
+_EV_FAVOR_REQUESTED = EventType.FAVOR_REQUESTED
+_REACT_EVENT_TYPES: frozenset[EventType] = frozenset((_EV_CARD_PLAYED, _EV_FAVOR_REQUESTED))
+
+# Discard-top types worth spending a five-different combo on
+PREMIUM_DISCARD: frozenset[str] = frozenset((DEFUSE, NOPE, SKIP, ATTACK, SHUFFLE, STF, FAVOR))
+ 
+# Cat cards are the first thing given away to a Favor; Defuse/Nope never are
+CAT_TYPES: frozenset[str] = frozenset((
+    "TacoCatCard",
+    "HairyPotatoCatCard",
+    "BeardCatCard",
+    "RainbowRalphingCatCard",
+    "CattermelonCard",
+))
+NEVER_GIVE: frozenset[str] = frozenset((DEFUSE, NOPE))
+ 
+# Combo "shape" of a hand: (card_type, count) per combo-able type, in first-seen order
+ComboShape = tuple[tuple[str, int], ...]
+# (combo_type, cards); and the first (three_of_a_kind, two_of_a_kind, five_different) found
+Combo = tuple[str, tuple[Card, ...]]
+ComboBuckets = tuple[Combo | None, Combo | None, Combo | None]
+
+
+@lru_cache(maxsize=4096)
+def _combos_for_shape(shape: ComboShape) -> tuple[tuple[str, str, int], ...]:
+    """
+    Combos available for a hand shape as (combo_type, card_type, cards_needed).
+    For five_different, card_type is empty and the first five shape entries are used.
+    Depends only on type counts, so it is shared across turns, games and bot instances.
+    """
+    combos: list[tuple[str, str, int]] = []
+    for card_type, count in shape:
+        if count >= 3:
+            combos.append(("three_of_a_kind", card_type, 3))
+        elif count >= 2:
+            combos.append(("two_of_a_kind", card_type, 2))
+    if len(shape) >= 5:
+        combos.append(("five_different", "", 5))
+    return tuple(combos)
+
+
 # Bot IDs are the bot names (with _2, _3 suffixes if duplicated)
 STRATEGIC_BOT_PREFIX = "chatgpt"
  
@@ -35,15 +80,54 @@ class MyBot(Bot):
     conservative defuse management, and lightweight opponent modeling.
     """
  
+    # Slots for MyBot's own state only; Bot declares none, so instances still have a __dict__.
+    __slots__ = (
+        "_turn_count", "_initial_player_count", "_first_ek_seen_from_other",
+        "_kittens_removed", "_baseline_kittens", "_known_top_cards",
+        "_opponent_card_counts", "_defuses_seen", "_rng",
+        "_hand_index", "_combo_cache",
+        "_others", "_other_counts", "_strategic_id", "_target_weak", "_target_strong",
+        "_event_handlers", "_react_handlers",
+    )
+ 
     def __init__(self) -> None:
         self._turn_count: int = 0
         self._initial_player_count: int | None = None
         self._first_ek_seen_from_other: bool = False
         self._kittens_removed: int = 0
-        self._known_top_cards: tuple[str, ...] | None = None
-        self._opponent_card_history: dict[str, list[str]] = {}
-        self._opponent_card_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._baseline_kittens: int = 1
+        self._known_top_cards: deque[str] | None = None
+        self._opponent_card_counts: dict[str, dict[str, int]] = {}
         self._defuses_seen: int = 0
+        # Private RNG: avoids the shared module-level generator and can be reseeded.
+        self._rng: random.Random = random.Random()
+        # Per-call index of my hand by card type; rebuilt on entry to take_turn/react.
+        self._hand_index: dict[str, list[Card]] = {}
+        # Last (hand index, combos, buckets); the same hand is searched more than once per turn.
+        self._combo_cache: tuple[dict[str, list[Card]], tuple[Combo, ...], ComboBuckets] | None = None
+        # Opponent snapshot and attack targets, resolved once per turn by _refresh_turn_targets.
+        self._others: tuple[str, ...] = ()
+        self._other_counts: dict[str, int] = {}
+        self._strategic_id: str | None = None
+        self._target_weak: str | None = None
+        self._target_strong: str | None = None
+        self._event_handlers: dict[EventType, Callable[[GameEvent, BotView], None]] = {
+            EventType.CARDS_PEEKED: self._on_cards_peeked,
+            EventType.DECK_SHUFFLED: self._on_deck_reordered,
+            EventType.EXPLODING_KITTEN_INSERTED: self._on_deck_reordered,
+            EventType.CARD_DRAWN: self._on_card_drawn,
+            EventType.EXPLODING_KITTEN_DRAWN: self._on_exploding_kitten_drawn,
+            EventType.PLAYER_ELIMINATED: self._on_player_eliminated,
+            EventType.CARD_PLAYED: self._on_card_played,
+        }
+        self._react_handlers: dict[
+            tuple[EventType, str | None],
+            Callable[[BotView, dict[str, object], Sequence[Card]], Action | None],
+        ] = {
+            (_EV_CARD_PLAYED, ATTACK): self._react_to_attack,
+            (_EV_CARD_PLAYED, FAVOR): self._react_to_favor,
+            (_EV_FAVOR_REQUESTED, None): self._react_to_favor_request,
+        }
  
     @property
     def name(self) -> str:
@@ -54,6 +138,9 @@ class MyBot(Bot):
     # ------------------------------------------------------------------ #
     def take_turn(self, view: BotView) -> Action:
         self._initialize_game_baseline(view)
+        self._build_hand_index(view)
+        self._combo_cache = None
+        self._refresh_turn_targets(view)
         self._turn_count += 1
  
         # Compute current EK risk to steer decisions for this turn.
@@ -77,27 +164,24 @@ class MyBot(Bot):
         Estimate probability of drawing an EK next draw.
         Incorporates peek knowledge and defuse cushioning.
         """
-        players: int = self._initial_player_count or len(view.turn_order)
-        baseline_kittens: int = max(1, players - 1 - self._kittens_removed)
         deck_size: int = max(1, view.draw_pile_count)
  
-        # Peek-aware adjustment
-        if self._known_top_cards:
-            visible = self._known_top_cards
-            if visible and visible[0] == EXPLODING:
+        # Peek-aware adjustment; a visible EK decides the answer outright.
+        visible = self._known_top_cards
+        if visible:
+            if visible[0] == EXPLODING:
                 return 1.0
             if EXPLODING in visible:
                 # Uniform within the peek slice
                 return 1.0 / float(len(visible))
             unseen = max(1, deck_size - len(visible))
-            return min(1.0, baseline_kittens / float(unseen))
+            return min(1.0, self._baseline_kittens / float(unseen))
  
         # Coarse baseline
-        risk: float = min(1.0, baseline_kittens / float(deck_size))
+        risk: float = min(1.0, self._baseline_kittens / float(deck_size))
  
         # Holding defuse lowers elimination risk; be slightly braver
-        defuses: int = view.count_cards_of_type(DEFUSE)
-        if defuses > 0:
+        if DEFUSE in self._hand_index:
             risk *= 0.6
         return risk
  
@@ -109,12 +193,12 @@ class MyBot(Bot):
         """
         Rough opponent model: probability they hold defense (Skip/Attack/Shuffle/Defuse/Nope).
         """
-        history: Counter[str] = self._opponent_card_counts.get(player_id, Counter())
+        history: dict[str, int] = self._opponent_card_counts.get(player_id, {})
         total_seen: int = sum(history.values())
         if total_seen == 0:
             return {"defensive": 0.3, "nope": 0.2}
-        defensive_cards = history[SKIP] + history[ATTACK] + history[SHUFFLE]
-        nope_cards = history[NOPE]
+        defensive_cards = history.get(SKIP, 0) + history.get(ATTACK, 0) + history.get(SHUFFLE, 0)
+        nope_cards = history.get(NOPE, 0)
         defensive_prob = min(0.8, defensive_cards / max(1, total_seen))
         nope_prob = min(0.7, nope_cards / max(1, total_seen))
         return {"defensive": defensive_prob, "nope": nope_prob}
@@ -123,6 +207,11 @@ class MyBot(Bot):
     # Decision tree
     # ------------------------------------------------------------------ #
     def decide_action(self, view: BotView, ek_probability: float) -> Action:
+        """
+        Single flat priority list: combo, peek, then the risk tier's branches
+        (early/low, midgame/control, late/high). Tiers are inlined so one
+        decision costs one frame plus whichever helper actually fires.
+        """
         # Against StrategicBot specifically, combos are extremely strong because
         # that bot only "Nope"s CARD_PLAYED events (Attack/Favor/Shuffle), and
         # combos produce COMBO_PLAYED events instead. So we bias heavily toward
@@ -131,64 +220,52 @@ class MyBot(Bot):
         if combo_action is not None:
             return combo_action
  
+        known = self._known_top_cards
+        index = self._hand_index
+ 
         # Moderate/high risk and no knowledge: peek first to inform play.
-        stf_cards: tuple[Card, ...] = view.get_cards_of_type(STF)
         if (
-            stf_cards
-            and self._known_top_cards is None
+            STF in index
+            and known is None
             and ek_probability >= 0.33
             and view.draw_pile_count > 0
         ):
             view.say("Peeking to anchor probabilities.")
-            return PlayCardAction(card=stf_cards[0])
+            return PlayCardAction(card=index[STF][0])
  
+        # Early game / low risk: draw and build hand; conserve tempo cards.
         if ek_probability < 0.33:
-            return self._early_low_risk(view)
-        if ek_probability < 0.5:
-            return self._midgame_control(view)
-        return self._late_high_risk(view, ek_probability)
- 
-    def _early_low_risk(self, view: BotView) -> Action:
-        """Early game: draw and build hand; conserve tempo cards."""
-        if view.my_turns_remaining > 1:
-            attack_cards = view.get_cards_of_type(ATTACK)
-            if attack_cards and view.other_players:
-                target = self._choose_attack_target(view)
+            if view.my_turns_remaining > 1 and ATTACK in index and self._others:
+                target = self._choose_attack_target()
                 if target:
                     view.say("Low risk: offloading turns to grow hand.")
-                    return PlayCardAction(card=attack_cards[0], target_player_id=target)
-        return DrawCardAction()
+                    return PlayCardAction(card=index[ATTACK][0], target_player_id=target)
+            return DrawCardAction()
+ 
+        has_strategic: bool = self._has_strategic_bot()
  
-    def _midgame_control(self, view: BotView) -> Action:
-        """Midgame: manage risk with info and soft avoidance."""
-        shuffle_cards = view.get_cards_of_type(SHUFFLE)
-        if shuffle_cards and self._known_top_cards and EXPLODING in self._known_top_cards:
+        # Midgame: manage risk with info and soft avoidance.
+        if ek_probability < 0.5:
             # StrategicBot tends to Nope Shuffle; prefer combo play (handled earlier).
-            if not self._has_strategic_bot(view):
+            if SHUFFLE in index and known and EXPLODING in known and not has_strategic:
                 view.say("Shuffling away a known threat.")
-                return PlayCardAction(card=shuffle_cards[0])
- 
-        # Skip/Attack if we know the top is dangerous
-        if self._known_top_cards and self._known_top_cards[0] == EXPLODING:
-            defensive = self.play_defensive(view)
-            if defensive:
-                return defensive
- 
-        # Favor/steal to improve hand quality
-        steal = self._steal_for_value(view, bias_for_stf=True)
-        if steal is not None:
-            return steal
- 
-        return DrawCardAction()
- 
-    def _late_high_risk(self, view: BotView, ek_probability: float) -> Action:
-        """Late/high risk: prioritize survival, then push risk to opponents."""
-        shuffle_cards = view.get_cards_of_type(SHUFFLE)
-        if shuffle_cards:
-            # StrategicBot tends to Nope Shuffle; prefer combos and skips first.
-            if not self._has_strategic_bot(view):
-                view.say("High risk: resetting deck.")
-                return PlayCardAction(card=shuffle_cards[0])
+                return PlayCardAction(card=index[SHUFFLE][0])
+            # Skip/Attack if we know the top is dangerous
+            if known and known[0] == EXPLODING:
+                defensive = self.play_defensive(view)
+                if defensive:
+                    return defensive
+            # Favor/steal to improve hand quality
+            steal = self._steal_for_value(view, bias_for_stf=True)
+            if steal is not None:
+                return steal
+            return DrawCardAction()
+ 
+        # Late game / high risk: prioritize survival, then push risk to opponents.
+        # StrategicBot tends to Nope Shuffle; prefer combos and skips first.
+        if SHUFFLE in index and not has_strategic:
+            view.say("High risk: resetting deck.")
+            return PlayCardAction(card=index[SHUFFLE][0])
  
         defensive = self.play_defensive(view)
         if defensive:
@@ -199,14 +276,8 @@ class MyBot(Bot):
             return aggressive
  
         # If we know top is safe and have multiple turns, chain skip after draw
-        if (
-            self._known_top_cards
-            and self._known_top_cards[0] != EXPLODING
-            and view.my_turns_remaining > 1
-        ):
-            skip_cards = view.get_cards_of_type(SKIP)
-            if skip_cards:
-                return PlayCardAction(card=skip_cards[0])
+        if known and known[0] != EXPLODING and view.my_turns_remaining > 1 and SKIP in index:
+            return PlayCardAction(card=index[SKIP][0])
  
         return DrawCardAction()
  
@@ -217,17 +288,17 @@ class MyBot(Bot):
         """
         Use skip/attack to avoid drawing when risk is high or top is dangerous.
         """
-        skip_cards = view.get_cards_of_type(SKIP)
+        skip_cards = self._cards_of_type(SKIP)
         if skip_cards:
             view.say("Defensive skip to avoid danger.")
             return PlayCardAction(card=skip_cards[0])
  
-        attack_cards = view.get_cards_of_type(ATTACK)
-        if attack_cards and view.other_players:
+        attack_cards = self._cards_of_type(ATTACK)
+        if attack_cards and self._others:
             # StrategicBot tends to Nope Attack; use only if it's not present.
-            if self._has_strategic_bot(view):
+            if self._has_strategic_bot():
                 return None
-            target = self._choose_attack_target(view)
+            target = self._choose_attack_target()
             if target:
                 view.say("Defensive attack: pass risk onward.")
                 return PlayCardAction(card=attack_cards[0], target_player_id=target)
@@ -241,12 +312,12 @@ class MyBot(Bot):
         if steal is not None:
             return steal
  
-        attack_cards = view.get_cards_of_type(ATTACK)
-        if attack_cards and view.other_players:
+        attack_cards = self._cards_of_type(ATTACK)
+        if attack_cards and self._others:
             # StrategicBot tends to Nope Attack; prefer combos (handled earlier).
-            if self._has_strategic_bot(view):
+            if self._has_strategic_bot():
                 return None
-            target = self._choose_attack_target(view, prefer_weak_defense=True)
+            target = self._choose_attack_target(prefer_weak_defense=True)
             if target:
                 view.say("Aggressive attack to force risky draws.")
                 return PlayCardAction(card=attack_cards[0], target_player_id=target)
@@ -256,71 +327,97 @@ class MyBot(Bot):
     # Event tracking / opponent model
     # ------------------------------------------------------------------ #
     def on_event(self, event: GameEvent, view: BotView) -> None:
-        if event.event_type == EventType.BOT_CHAT:
-            return
+        # Table dispatch; untracked events (chat, turn bookkeeping, ...) fall through.
+        handler = self._event_handlers.get(event.event_type)
+        if handler is not None:
+            handler(event, view)
  
-        if event.event_type == EventType.CARDS_PEEKED and event.player_id == view.my_id:
-            card_types: Sequence[str] = tuple(event.data.get("card_types", ()))
-            self._known_top_cards = tuple(card_types)
+    def _on_cards_peeked(self, event: GameEvent, view: BotView) -> None:
+        if event.player_id == view.my_id:
+            card_types: Sequence[str] = tuple(sys.intern(str(t)) for t in event.data.get("card_types", ()))
+            self._known_top_cards = deque(card_types)
  
-        if event.event_type in (EventType.DECK_SHUFFLED, EventType.EXPLODING_KITTEN_INSERTED):
-            self._known_top_cards = None
+    def _on_deck_reordered(self, event: GameEvent, view: BotView) -> None:
+        self._known_top_cards = None
  
-        if event.event_type == EventType.CARD_DRAWN and self._known_top_cards:
+    def _on_card_drawn(self, event: GameEvent, view: BotView) -> None:
+        if self._known_top_cards:
             # Drop the known top card when any draw occurs.
-            self._known_top_cards = self._known_top_cards[1:]
- 
-        if event.event_type == EventType.EXPLODING_KITTEN_DRAWN:
-            if event.player_id != view.my_id:
-                self._first_ek_seen_from_other = True
- 
-        if event.event_type == EventType.PLAYER_ELIMINATED:
-            # Assume EK was consumed when a player dies without defuse.
-            self._kittens_removed = max(0, self._kittens_removed + 1)
- 
-        if event.event_type == EventType.CARD_PLAYED:
-            card_type = event.data.get("card_type", "")
-            player_id = event.player_id
-            if player_id and player_id != view.my_id and player_id in view.other_players:
-                self._opponent_card_history.setdefault(player_id, []).append(card_type)
-                self._opponent_card_counts[player_id][card_type] += 1
-            if card_type == DEFUSE:
-                self._defuses_seen += 1
+            self._known_top_cards.popleft()
+ 
+    def _on_exploding_kitten_drawn(self, event: GameEvent, view: BotView) -> None:
+        if event.player_id != view.my_id:
+            self._first_ek_seen_from_other = True
+ 
+    def _on_player_eliminated(self, event: GameEvent, view: BotView) -> None:
+        # Assume EK was consumed when a player dies without defuse.
+        self._kittens_removed = max(0, self._kittens_removed + 1)
+        self._refresh_baseline_kittens()
+ 
+    def _on_card_played(self, event: GameEvent, view: BotView) -> None:
+        # Intern so the counter keys and DEFUSE comparison hit the identity fast path.
+        card_type: str = sys.intern(str(event.data.get("card_type", "")))
+        player_id = event.player_id
+        if player_id and player_id != view.my_id and player_id in view.other_players:
+            counts = self._opponent_card_counts.get(player_id)
+            if counts is None:
+                counts = self._opponent_card_counts[player_id] = {}
+            counts[card_type] = counts.get(card_type, 0) + 1
+        if card_type == DEFUSE:
+            self._defuses_seen += 1
  
     # ------------------------------------------------------------------ #
     # Reactions
     # ------------------------------------------------------------------ #
     def react(self, view: BotView, triggering_event: GameEvent) -> Action | None:
-        nope_cards = view.get_cards_of_type(NOPE)
+        self._build_hand_index(view)
+        nope_cards = self._cards_of_type(NOPE)
         if not nope_cards:
             return None
  
         event_type: EventType = triggering_event.event_type
-        data: dict[str, object] = triggering_event.data
  
-        if event_type == EventType.CARD_PLAYED:
-            card_type = str(data.get("card_type", ""))
-            target_id: str | None = (
-                str(data.get("target_player_id")) if data.get("target_player_id") is not None else None
+        # Table dispatch on (event type, played card type); card type is None
+        # for events that aren't a single card being played. Other event types
+        # have no handler, so skip straight to the spare-Nope roll.
+        if event_type in _REACT_EVENT_TYPES:
+            data: dict[str, object] = triggering_event.data
+            card_type: str | None = (
+                sys.intern(str(data.get("card_type", ""))) if event_type == _EV_CARD_PLAYED else None
             )
+            handler = self._react_handlers.get((event_type, card_type))
+            if handler is not None:
+                action = handler(view, data, nope_cards)
+                if action is not None:
+                    return action
  
-            if card_type == ATTACK and target_id == view.my_id:
-                view.say("Nope! Not taking extra turns.")
-                return PlayCardAction(card=nope_cards[0])
+        # Be stingier with random nopes; 10% when we have spares.
+        if len(nope_cards) > 1 and self._rng.random() < 0.1:
+            return PlayCardAction(card=nope_cards[0])
  
-            if card_type == FAVOR and target_id == view.my_id:
-                view.say("Nope! Keep your hands off my cards.")
-                return PlayCardAction(card=nope_cards[0])
+        return None
  
-        if event_type == EventType.FAVOR_REQUESTED:
-            target_id = triggering_event.data.get("target")
-            if target_id == view.my_id:
-                return PlayCardAction(card=nope_cards[0])
+    def _react_to_attack(
+        self, view: BotView, data: dict[str, object], nope_cards: Sequence[Card]
+    ) -> Action | None:
+        if data.get("target_player_id") == view.my_id:
+            view.say("Nope! Not taking extra turns.")
+            return PlayCardAction(card=nope_cards[0])
+        return None
  
-        # Be stingier with random nopes; 10% when we have spares.
-        if len(nope_cards) > 1 and random.random() < 0.1:
+    def _react_to_favor(
+        self, view: BotView, data: dict[str, object], nope_cards: Sequence[Card]
+    ) -> Action | None:
+        if data.get("target_player_id") == view.my_id:
+            view.say("Nope! Keep your hands off my cards.")
             return PlayCardAction(card=nope_cards[0])
+        return None
  
+    def _react_to_favor_request(
+        self, view: BotView, data: dict[str, object], nope_cards: Sequence[Card]
+    ) -> Action | None:
+        if data.get("target") == view.my_id:
+            return PlayCardAction(card=nope_cards[0])
         return None
  
     # ------------------------------------------------------------------ #
@@ -334,20 +431,23 @@ class MyBot(Bot):
             return 0
         safe_top = 1
         safe_bottom = max(1, draw_pile_size - 1)
-        return random.randint(safe_top, safe_bottom)
+        return self._rng.randrange(safe_top, safe_bottom + 1)
  
     def choose_card_to_give(self, view: BotView, requester_id: str) -> Card:
         """
         Favor response: give lowest-value card; keep defuse/nope.
         """
-        hand: list[Card] = list(view.my_hand)
-        cat_cards = [c for c in hand if "Cat" in c.card_type]
-        if cat_cards:
-            return cat_cards[0]
-        expendable = [c for c in hand if c.card_type not in (DEFUSE, NOPE)]
-        if expendable:
-            return expendable[0]
-        return hand[0]
+        # Single pass over the hand: the first cat card wins outright.
+        expendable: Card | None = None
+        for card in view.my_hand:
+            card_type: str = card.card_type
+            if card_type in CAT_TYPES:
+                return card
+            if expendable is None and card_type not in NEVER_GIVE:
+                expendable = card
+        if expendable is not None:
+            return expendable
+        return view.my_hand[0]
  
     def on_explode(self, view: BotView) -> None:
         view.say("So long, cruel kitten universe!")
@@ -358,36 +458,63 @@ class MyBot(Bot):
     def _initialize_game_baseline(self, view: BotView) -> None:
         if self._initial_player_count is None:
             self._initial_player_count = len(view.turn_order)
+            self._refresh_baseline_kittens()
+ 
+    def _refresh_baseline_kittens(self) -> None:
+        """Recompute the expected EK count; only changes on setup and eliminations."""
+        if self._initial_player_count is not None:
+            self._baseline_kittens = max(1, self._initial_player_count - 1 - self._kittens_removed)
+ 
+    def _build_hand_index(self, view: BotView) -> None:
+        """Group my hand by card type once so lookups don't rescan it."""
+        index: dict[str, list[Card]] = {}
+        for card in view.my_hand:
+            index.setdefault(card.card_type, []).append(card)
+        self._hand_index = index
+ 
+    def _cards_of_type(self, card_type: str) -> Sequence[Card]:
+        return self._hand_index.get(card_type, ())
  
     def _is_first_turn(self) -> bool:
         return self._turn_count == 1
  
-    def _choose_attack_target(self, view: BotView, prefer_weak_defense: bool = False) -> str | None:
-        if not view.other_players:
-            return None
-        strategic = self._find_strategic_bot_id(view)
-        if strategic is not None:
+    def _choose_attack_target(self, prefer_weak_defense: bool = False) -> str | None:
+        if self._strategic_id is not None:
             # When StrategicBot is in the game, focus pressure on it.
-            return strategic
+            return self._strategic_id
         if prefer_weak_defense:
-            # Pick opponent with fewest cards (likely weaker defenses)
-            return min(
-                view.other_players,
-                key=lambda pid: view.other_player_card_counts.get(pid, 0),
-            )
-        return max(
-            view.other_players,
-            key=lambda pid: view.other_player_card_counts.get(pid, 0),
-        )
+            # Opponent with fewest cards (likely weaker defenses)
+            return self._target_weak
+        return self._target_strong
+ 
+    def _refresh_turn_targets(self, view: BotView) -> None:
+        """Resolve this turn's attack targets with one scan over the opponents."""
+        self._others = view.other_players
+        self._other_counts = view.other_player_card_counts
+        self._strategic_id = self._find_strategic_bot_id()
+        counts: dict[str, int] = self._other_counts
+        weak: str | None = None
+        strong: str | None = None
+        weak_count: int = 0
+        strong_count: int = 0
+        for pid in self._others:
+            count: int = counts.get(pid, 0)
+            # Strict comparisons keep the first player on ties, like min()/max().
+            if weak is None or count < weak_count:
+                weak, weak_count = pid, count
+            if strong is None or count > strong_count:
+                strong, strong_count = pid, count
+        self._target_weak = weak
+        self._target_strong = strong
  
     def _play_after_first_ek(self, view: BotView) -> Action | None:
         if not self._first_ek_seen_from_other:
             return None
-        shuffle_cards = view.get_cards_of_type(SHUFFLE)
+        shuffle_cards = self._cards_of_type(SHUFFLE)
         if shuffle_cards:
             view.say("Resetting uncertainty after first EK appeared.")
             return PlayCardAction(card=shuffle_cards[0])
-        stf_cards = view.get_cards_of_type(STF)
+        stf_cards = self._cards_of_type(STF)
         if stf_cards and view.draw_pile_count > 0:
             return PlayCardAction(card=stf_cards[0])
         steal = self._steal_for_value(view, bias_for_stf=True)
@@ -402,57 +529,76 @@ class MyBot(Bot):
         return DrawCardAction()
  
     def _steal_for_value(self, view: BotView, bias_for_stf: bool) -> Action | None:
-        if not view.other_players:
+        if not self._others:
             return None
-        target = self._choose_attack_target(view, prefer_weak_defense=bias_for_stf)
+        target = self._choose_attack_target(prefer_weak_defense=bias_for_stf)
         if target is None:
             return None
  
         # Prefer combos over Favor, especially vs StrategicBot (which nopes Favor).
-        combos = self._find_possible_combos(view.my_hand)
-        for combo_type, combo_cards in combos:
-            if combo_type in ("three_of_a_kind", "two_of_a_kind", "five_different"):
-                view.say("Combo value play.")
-                return PlayComboAction(cards=combo_cards, target_player_id=target)
- 
-        favor_cards = view.get_cards_of_type(FAVOR)
-        if favor_cards and not self._has_strategic_bot(view):
+        # Every combo kind qualifies, so the first one found is the one to play.
+        combos = self._find_possible_combos()
+        if combos:
+            view.say("Combo value play.")
+            return PlayComboAction(cards=combos[0][1], target_player_id=target)
+ 
+        favor_cards = self._cards_of_type(FAVOR)
+        if favor_cards and not self._has_strategic_bot():
             view.say(f"Requesting a card from {target}.")
             return PlayCardAction(card=favor_cards[0], target_player_id=target)
         return None
  
-    def _find_possible_combos(
-        self, hand: tuple[Card, ...]
-    ) -> tuple[tuple[str, tuple[Card, ...]], ...]:
-        combo_candidates: tuple[Card, ...] = tuple(c for c in hand if c.can_combo())
-        if not combo_candidates:
-            return ()
-        by_type: Counter[str] = Counter(c.card_type for c in combo_candidates)
-        combos: list[tuple[str, tuple[Card, ...]]] = []
-        for card_type, count in by_type.items():
-            cards_of_type: list[Card] = [c for c in combo_candidates if c.card_type == card_type]
-            if count >= 3:
-                combos.append(("three_of_a_kind", tuple(cards_of_type[:3])))
-            elif count >= 2:
-                combos.append(("two_of_a_kind", tuple(cards_of_type[:2])))
-        if len(by_type) >= 5:
-            unique_cards: list[Card] = []
-            for card_type in by_type.keys():
-                if len(unique_cards) >= 5:
-                    break
-                for card in combo_candidates:
-                    if card.card_type == card_type:
-                        unique_cards.append(card)
-                        break
-            if len(unique_cards) >= 5:
-                combos.append(("five_different", tuple(unique_cards[:5])))
-        return tuple(combos)
- 
-    def _has_strategic_bot(self, view: BotView) -> bool:
-        return self._find_strategic_bot_id(view) is not None
- 
-    def _find_strategic_bot_id(self, view: BotView) -> str | None:
-        for pid in view.other_players:
+    def _find_possible_combos(self) -> tuple[Combo, ...]:
+        """List the combos available in the indexed hand, in hand order."""
+        return self._combo_search()[0]
+ 
+    def _combo_buckets(self) -> ComboBuckets:
+        """First three-of-a-kind, first two-of-a-kind and five-different (each or None)."""
+        return self._combo_search()[1]
+ 
+    def _combo_search(self) -> tuple[tuple[Combo, ...], ComboBuckets]:
+        index = self._hand_index
+        cache = self._combo_cache
+        if cache is not None and cache[0] is index:
+            return cache[1], cache[2]
+        combos, buckets = self._search_combos(index)
+        self._combo_cache = (index, combos, buckets)
+        return combos, buckets
+ 
+    def _search_combos(self, index: dict[str, list[Card]]) -> tuple[tuple[Combo, ...], ComboBuckets]:
+        # The hand index is already grouped by type in first-seen order; combo
+        # eligibility is per type, so test one card of each group.
+        shape: ComboShape = tuple(
+            (card_type, len(cards)) for card_type, cards in index.items() if cards[0].can_combo()
+        )
+        if not shape:
+            return (), (None, None, None)
+        # Map the memoized shape back onto this hand's cards, noting the first
+        # combo of each kind on the way.
+        combos: list[Combo] = []
+        three: Combo | None = None
+        two: Combo | None = None
+        five: Combo | None = None
+        for combo_type, card_type, needed in _combos_for_shape(shape):
+            if combo_type == "five_different":
+                five = (combo_type, tuple(index[t][0] for t, _ in shape[:5]))
+                combos.append(five)
+                continue
+            combo: Combo = (combo_type, tuple(index[card_type][:needed]))
+            if combo_type == "three_of_a_kind":
+                if three is None:
+                    three = combo
+            elif two is None:
+                two = combo
+            combos.append(combo)
+        return tuple(combos), (three, two, five)
+ 
+    def _has_strategic_bot(self) -> bool:
+        # Resolved once per turn in _refresh_turn_targets.
+        return self._strategic_id is not None
+ 
+    def _find_strategic_bot_id(self) -> str | None:
+        for pid in self._others:
             if pid.startswith(STRATEGIC_BOT_PREFIX):
                 return pid
         return None
@@ -466,49 +612,33 @@ class MyBot(Bot):
         - 3-of-a-kind: great (steals random in this engine, but still strong)
         - 2-of-a-kind: steal random, very strong vs StrategicBot
         """
-        if not view.other_players:
+        if not self._others:
             return None
  
         # Must have a target with cards for steals to matter.
-        target = self._choose_attack_target(view, prefer_weak_defense=False)
+        target = self._choose_attack_target(prefer_weak_defense=False)
         if target is None:
             return None
-        if view.other_player_card_counts.get(target, 0) <= 0:
-            # Fallback to any player with cards
-            with_cards = [pid for pid in view.other_players if view.other_player_card_counts.get(pid, 0) > 0]
-            if not with_cards:
+        if self._other_counts.get(target, 0) <= 0:
+            # Fallback to the first player with cards
+            counts = self._other_counts
+            target = next((pid for pid in self._others if counts.get(pid, 0) > 0), None)
+            if target is None:
                 return None
-            target = with_cards[0]
  
-        combos = self._find_possible_combos(view.my_hand)
-        if not combos:
-            return None
- 
-        # Five-different is only good if the discard top is a premium card.
-        top_discard_type: str | None = view.discard_pile[-1].card_type if view.discard_pile else None
-        premium = {DEFUSE, NOPE, SKIP, ATTACK, SHUFFLE, STF, FAVOR}
- 
-        best: tuple[str, tuple[Card, ...]] | None = None
-        for combo_type, cards in combos:
-            if combo_type == "five_different":
-                if top_discard_type is not None and top_discard_type in premium:
-                    best = (combo_type, cards)
-                    break
-                continue
-            if combo_type == "three_of_a_kind":
-                best = (combo_type, cards)
-                break
-            if combo_type == "two_of_a_kind" and best is None:
-                best = (combo_type, cards)
- 
-        if best is None:
-            return None
- 
-        combo_type, cards = best
-        if combo_type == "five_different":
-            view.say("Five different: taking top discard.")
-            return PlayComboAction(cards=cards)
-        view.say("Combo steal.")
-        return PlayComboAction(cards=cards, target_player_id=target)
+        three, two, five = self._combo_buckets()
+        if three is not None:
+            view.say("Combo steal.")
+            return PlayComboAction(cards=three[1], target_player_id=target)
+        if five is not None:
+            # Only good if the discard top is a premium card.
+            discard_pile = view.discard_pile
+            if discard_pile and discard_pile[-1].card_type in PREMIUM_DISCARD:
+                view.say("Five different: taking top discard.")
+                return PlayComboAction(cards=five[1])
+        if two is not None:
+            view.say("Combo steal.")
+            return PlayComboAction(cards=two[1], target_player_id=target)
+        return None
  
  
\ No newline at end of file
@@ -15,8 +15,11 @@ Core Principles:
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Sequence
+import sys
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from typing import Any, Callable, Sequence
 
 from game.bots.base import (
     Action,
@@ -29,7 +32,8 @@ from game.bots.view import BotView
 from game.cards.base import Card
 from game.history import EventType, GameEvent
 
-# Card type constants
+# Card type constants. String literals are interned, and so are the card types
+# read from event data, so every == / in check below is an identity hit.
 STF = "SeeTheFutureCard"
 SKIP = "SkipCard"
 ATTACK = "AttackCard"
@@ -39,6 +43,44 @@ NOPE = "NopeCard"
 DEFUSE = "DefuseCard"
 EXPLODING = "ExplodingKittenCard"
 
+# Event types react() checks, bound once so the comparison is a single global load
+_EV_CARD_PLAYED = EventType.CARD_PLAYED
+_EV_COMBO_PLAYED = EventType.COMBO_PLAYED
+_REACT_EVENT_TYPES: frozenset[EventType] = frozenset((_EV_CARD_PLAYED, _EV_COMBO_PLAYED))
+
+# Cat cards: no effect alone, so they are given away first
+CAT_TYPES: frozenset[str] = frozenset((
+    "TacoCatCard",
+    "HairyPotatoCatCard",
+    "BeardCatCard",
+    "RainbowRalphingCatCard",
+    "CattermelonCard",
+))
+
+# Plays that signal an opponent can defend itself, and their slots in the
+# per-opponent play tally
+DEFENSIVE_TYPES: frozenset[str] = frozenset((SKIP, ATTACK, SHUFFLE, DEFUSE))
+TALLY_PLAYS = 0
+TALLY_DEFENSIVE = 1
+TALLY_NOPE = 2
+
+# Bit flags for "do I hold this type?" checks; the per-turn mask is built in _index_hand
+STF_BIT = 1 << 0
+SKIP_BIT = 1 << 1
+ATTACK_BIT = 1 << 2
+SHUFFLE_BIT = 1 << 3
+FAVOR_BIT = 1 << 4
+TYPE_BITS: dict[str, int] = {
+    STF: STF_BIT,
+    SKIP: SKIP_BIT,
+    ATTACK: ATTACK_BIT,
+    SHUFFLE: SHUFFLE_BIT,
+    FAVOR: FAVOR_BIT,
+}
+
+# High-value cards: worth a five-different recovery, never given away for Favor
+PREMIUM_TYPES: frozenset[str] = frozenset((DEFUSE, NOPE, SHUFFLE, STF))
+
 
 class MastermindBot(Bot):
     """
@@ -53,6 +95,23 @@ class MastermindBot(Bot):
     6. Resource optimization: Smart card usage based on game state
     """
     
+    # Every attribute set in __init__, take_turn or on_event must be listed here.
+    # Bot itself has no __slots__, so instances keep a __dict__, but these names
+    # resolve through slot descriptors instead of it.
+    __slots__ = (
+        "_turn_count", "_initial_player_count", "_first_ek_seen",
+        "_kittens_removed", "_defuses_used",
+        "_known_top_cards", "_peek_version", "_deck_shuffled", "_last_shuffle_turn",
+        "_opponent_play_tally", "_opponent_defense_prob",
+        "_opponent_nope_prob", "_opponent_defuses_used", "_opponent_last_seen_hand_size",
+        "_game_phase", "_mid_threshold", "_my_defuses", "_just_peeked",
+        "_stf_planning_turns",
+        "_event_handlers", "_react_handlers", "_phase_strategies",
+        "_hand_by_type", "_hand_mask",
+        "_opp_by_count", "_opp_with_cards", "_opp_counts", "_weakest_target",
+        "_ek_risk_cache", "_combos_cache",
+    )
+    
     def __init__(self) -> None:
         """Initialize bot with comprehensive state tracking."""
         # Game state
@@ -63,13 +122,14 @@ class MastermindBot(Bot):
         self._defuses_used: int = 0
         
         # Information tracking
-        self._known_top_cards: tuple[str, ...] | None = None
+        self._known_top_cards: deque[str] | None = None
+        self._peek_version: int = 0  # bumped whenever _known_top_cards changes
         self._deck_shuffled: bool = True  # Start in shuffled state
         self._last_shuffle_turn: int = -1
         
         # Opponent modeling
-        self._opponent_card_history: dict[str, list[str]] = {}
-        self._opponent_card_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        # Per-opponent [plays, defensive plays, Nope plays], indexed by the TALLY_* slots
+        self._opponent_play_tally: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
         self._opponent_defense_prob: dict[str, float] = {}  # Probability they have defense
         self._opponent_nope_prob: dict[str, float] = {}  # Probability they have Nope
         self._opponent_defuses_used: dict[str, bool] = {}  # Track who has used defuses
@@ -77,10 +137,52 @@ class MastermindBot(Bot):
         
         # Strategic state
         self._game_phase: str = "early"  # early, mid, late
+        self._mid_threshold: int = 0  # min alive players for "mid", set with _initial_player_count
         self._my_defuses: int = 0
         self._just_peeked: bool = False
         self._stf_planning_turns: int = 0  # How many turns ahead we're planning
         
+        # on_event dispatch; untracked events (chat, turn bookkeeping, ...) are ignored
+        self._event_handlers: dict[EventType, Callable[[GameEvent, BotView], None]] = {
+            EventType.CARDS_PEEKED: self._on_cards_peeked,
+            EventType.DECK_SHUFFLED: self._on_deck_reordered,
+            EventType.EXPLODING_KITTEN_INSERTED: self._on_deck_reordered,
+            EventType.CARD_DRAWN: self._on_card_drawn,
+            EventType.EXPLODING_KITTEN_DRAWN: self._on_exploding_kitten_drawn,
+            EventType.PLAYER_ELIMINATED: self._on_player_eliminated,
+            EventType.CARD_PLAYED: self._on_card_played,
+            EventType.EXPLODING_KITTEN_DEFUSED: self._on_defuse_used,
+        }
+        # react dispatch, keyed on (event type, played card type or None)
+        self._react_handlers: dict[
+            tuple[EventType, str | None],
+            Callable[[BotView, dict[str, Any], Sequence[Card]], Action | None],
+        ] = {
+            (_EV_CARD_PLAYED, ATTACK): self._react_to_attack,
+            (_EV_CARD_PLAYED, FAVOR): self._react_to_favor,
+            (_EV_COMBO_PLAYED, None): self._react_to_combo,
+        }
+        # Phase strategy dispatch, keyed on _game_phase
+        self._phase_strategies: dict[str, Callable[[BotView, float], Action]] = {
+            "early": self._early_game_strategy,
+            "mid": self._midgame_strategy,
+            "late": self._late_game_strategy,
+        }
+        
+        # Per-turn hand index (card_type -> cards), rebuilt at the start of take_turn
+        self._hand_by_type: dict[str, list[Card]] = {}
+        self._hand_mask: int = 0  # OR of TYPE_BITS for the types in _hand_by_type
+        # Per-turn opponent snapshot: (pid, card_count) sorted ascending, and the
+        # suffix of it holding at least one card
+        self._opp_by_count: list[tuple[str, int]] = []
+        self._opp_with_cards: list[tuple[str, int]] = []
+        self._opp_counts: list[int] = []  # card counts of _opp_by_count, for bisect
+        self._weakest_target: str | None = None
+        # Last ((draw pile, players, kittens removed, peek version, defuses), risk) pair
+        self._ek_risk_cache: tuple[tuple[int, int | None, int, int, int], float] | None = None
+        # Last (hand, combos) search; several strategy branches probe the same hand
+        self._combos_cache: tuple[tuple[Card, ...], list[tuple[str, tuple[Card, ...]]]] | None = None
+        
     @property
     def name(self) -> str:
         """Return bot name."""
@@ -92,25 +194,28 @@ class MastermindBot(Bot):
     
     def take_turn(self, view: BotView) -> Action:
         """Main turn decision logic with adaptive strategy."""
+        self._index_hand(view)
+        self._combos_cache = None
         self._update_game_state(view)
         self._turn_count += 1
         
         # Update game phase
         self._update_game_phase(view)
         
-        # Calculate precise EK risk
-        ek_risk = self._calculate_ek_risk(view)
-        
-        # Early game: conservative draw strategy
-        if self._game_phase == "early":
-            return self._early_game_strategy(view, ek_risk)
-        
-        # Mid game: information and control
-        if self._game_phase == "mid":
-            return self._midgame_strategy(view, ek_risk)
+        # Opening book: forced moves that don't depend on the risk estimate,
+        # so skip the probability math and the phase strategies entirely.
+        # First turn: always draw (low risk, need cards)
+        if self._turn_count == 1 and self._game_phase == "early":
+            return DrawCardAction()
+        # SURVIVAL - If EK is on top, avoid it (priority 1 in every phase)
+        if self._known_top_cards and self._known_top_cards[0] == EXPLODING:
+            return self._avoid_ek_on_top(view)
         
-        # Late game: survival and aggression
-        return self._late_game_strategy(view, ek_risk)
+        # Calculate precise EK risk, then hand off to the phase strategy:
+        # early = conservative draws, mid = information and control,
+        # late = survival and aggression
+        ek_risk = self._calculate_ek_risk(view)
+        return self._phase_strategies[self._game_phase](view, ek_risk)
     
     # ========================================================================
     # PROBABILITY CALCULATION
@@ -124,8 +229,27 @@ class MastermindBot(Bot):
         - Known top cards from STF
         - Defuse cushioning (having defuses reduces effective risk)
         - Accurate EK count tracking
+        
+        The result is a pure function of the key below, so repeated calls in a
+        multi-action turn (nothing drawn, nothing peeked) reuse the last value.
         """
-        if view.draw_pile_count == 0:
+        key = (
+            view.draw_pile_count,
+            self._initial_player_count,
+            self._kittens_removed,
+            self._peek_version,
+            self._my_defuses,
+        )
+        if self._ek_risk_cache is not None and self._ek_risk_cache[0] == key:
+            return self._ek_risk_cache[1]
+        risk = self._compute_ek_risk(view)
+        self._ek_risk_cache = (key, risk)
+        return risk
+    
+    def _compute_ek_risk(self, view: BotView) -> float:
+        """Uncached body of _calculate_ek_risk."""
+        draw_n = view.draw_pile_count
+        if draw_n == 0:
             return 0.0
         
         # Calculate baseline EK count
@@ -149,14 +273,14 @@ class MastermindBot(Bot):
                 else:
                     return 0.33  # 33% chance
             # No EK in peek, recalculate with unseen cards
-            unseen = max(1, view.draw_pile_count - len(visible))
+            unseen = max(1, draw_n - len(visible))
             risk = min(1.0, baseline_kittens / float(unseen))
         else:
             # No peek info - use baseline
-            risk = min(1.0, baseline_kittens / float(view.draw_pile_count))
+            risk = min(1.0, baseline_kittens / float(draw_n))
         
         # Defuse cushioning: having defuses reduces effective risk
-        defuses = view.count_cards_of_type(DEFUSE)
+        defuses = self._my_defuses
         if defuses > 0:
             # Each defuse reduces risk perception (we can survive one EK)
             risk *= max(0.3, 1.0 - (defuses * 0.25))
@@ -177,28 +301,20 @@ class MastermindBot(Bot):
         - Only use combos if opponent has few cards (high chance of Defuse)
         - Avoid wasting Skip/Attack (save for when EK is imminent)
         """
-        # First turn: always draw (low risk, need cards)
-        if self._turn_count == 1:
-            return DrawCardAction()
-        
-        # Priority 1: SURVIVAL - If EK is on top, avoid it
-        if self._known_top_cards and self._known_top_cards[0] == EXPLODING:
-            return self._avoid_ek_on_top(view)
+        # First turn and Priority 1 (EK on top) are handled by take_turn's opening book
+        draw_n = view.draw_pile_count
+        others = view.other_players
         
         # Priority 2: Information gathering with STF (plan multiple turns ahead)
         if not self._known_top_cards and not self._just_peeked:
-            stf_cards = view.get_cards_of_type(STF)
-            if stf_cards and view.draw_pile_count > 0 and ek_risk >= 0.20:
+            if self._hand_mask & STF_BIT and draw_n > 0 and ek_risk >= 0.20:
                 view.say("Planning ahead...")
                 self._just_peeked = True
-                return PlayCardAction(card=stf_cards[0])
+                return PlayCardAction(card=self._hand_by_type[STF][0])
         
         # Priority 3: Use combos to steal from players with few cards (high Defuse chance)
-        if view.other_players:
-            weak_targets = [
-                pid for pid in view.other_players
-                if view.other_player_card_counts.get(pid, 0) <= 2
-            ]
+        if others:
+            weak_targets = [pid for pid, _ in self._opponents_with_at_most(2)]
             if weak_targets:
                 combo_action = self._try_combo_against_targets(view, weak_targets)
                 if combo_action:
@@ -221,16 +337,16 @@ class MastermindBot(Bot):
         - Use Attack to push dangerous draws onto unprepared opponents
         - Continue information gathering
         """
-        # Priority 1: SURVIVAL - If EK is on top, avoid it
-        if self._known_top_cards and self._known_top_cards[0] == EXPLODING:
-            return self._avoid_ek_on_top(view)
+        # Priority 1 (EK on top) is handled by take_turn's opening book
+        hand = view.my_hand
+        others = view.other_players
+        draw_n = view.draw_pile_count
         
         # Priority 2: Hand disruption - target players with few cards (high Defuse chance)
-        if view.other_players:
+        if others:
             weak_targets = [
-                pid for pid in view.other_players
-                if view.other_player_card_counts.get(pid, 0) <= 3
-                and not self._opponent_defuses_used.get(pid, False)
+                pid for pid, _ in self._opponents_with_at_most(3)
+                if not self._opponent_defuses_used.get(pid, False)
             ]
             if weak_targets:
                 # Use combos first (harder to Nope)
@@ -239,30 +355,27 @@ class MastermindBot(Bot):
                     return combo_action
                 
                 # Use Favor to deplete opponents
-                favor_cards = view.get_cards_of_type(FAVOR)
-                if favor_cards:
-                    target = min(weak_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+                if self._hand_mask & FAVOR_BIT:
+                    target = weak_targets[0]  # fewest cards (list is sorted)
                     view.say("Depleting opponent resources.")
-                    return PlayCardAction(card=favor_cards[0], target_player_id=target)
+                    return PlayCardAction(card=self._hand_by_type[FAVOR][0], target_player_id=target)
         
         # Priority 3: Information gathering (plan ahead)
         if not self._known_top_cards and not self._just_peeked and ek_risk >= 0.25:
-            stf_cards = view.get_cards_of_type(STF)
-            if stf_cards and view.draw_pile_count > 0:
+            if self._hand_mask & STF_BIT and draw_n > 0:
                 self._just_peeked = True
                 view.say("Gathering intelligence...")
-                return PlayCardAction(card=stf_cards[0])
+                return PlayCardAction(card=self._hand_by_type[STF][0])
         
         # Priority 4: Shuffle to disrupt opponents who may have peeked
         if self._known_top_cards and EXPLODING in self._known_top_cards:
-            shuffle_cards = view.get_cards_of_type(SHUFFLE)
-            if shuffle_cards and self._turn_count > self._last_shuffle_turn + 2:
+            if self._hand_mask & SHUFFLE_BIT and self._turn_count > self._last_shuffle_turn + 2:
                 view.say("Disrupting opponent intel.")
                 self._last_shuffle_turn = self._turn_count
-                return PlayCardAction(card=shuffle_cards[0])
+                return PlayCardAction(card=self._hand_by_type[SHUFFLE][0])
         
         # Priority 5: General stealing (if we have large hand and risk is low)
-        if len(view.my_hand) >= 6 and ek_risk < 0.35:
+        if len(hand) >= 6 and ek_risk < 0.35:
             steal_action = self._try_steal(view, ek_risk)
             if steal_action:
                 return steal_action
@@ -290,39 +403,34 @@ class MastermindBot(Bot):
         - Defuse cards are most valuable - protect them
         - Use Attack to push dangerous draws onto unprepared opponents
         """
-        # Priority 1: SURVIVAL - If EK is on top, use Skip/Attack (this is when they're vital)
-        if self._known_top_cards and self._known_top_cards[0] == EXPLODING:
-            return self._avoid_ek_on_top(view)
+        # Priority 1 (EK on top, Skip/Attack are vital) is handled by take_turn's opening book
+        others = view.other_players
+        draw_n = view.draw_pile_count
         
         # Priority 2: If risk is very high and deck is thin, use Skip/Attack
-        if ek_risk >= 0.60 and view.draw_pile_count <= 10:
+        if ek_risk >= 0.60 and draw_n <= 10:
             defensive = self._play_defensive(view)
             if defensive:
                 return defensive
         
         # Priority 3: Use Attack to force multiple draws from thin deck
-        if ek_risk >= 0.50 and view.draw_pile_count <= 15 and len(view.other_players) > 1:
-            attack_cards = view.get_cards_of_type(ATTACK)
-            if attack_cards:
+        if ek_risk >= 0.50 and draw_n <= 15 and len(others) > 1:
+            if self._hand_mask & ATTACK_BIT:
                 # Target weakest opponent (likely to lack defense)
-                target = self._choose_weakest_target(view)
+                target = self._choose_weakest_target()
                 if target:
                     view.say("Forcing multiple draws from thin deck.")
-                    return PlayCardAction(card=attack_cards[0], target_player_id=target)
+                    return PlayCardAction(card=self._hand_by_type[ATTACK][0], target_player_id=target)
         
         # Priority 4: Shuffle to reset odds (if not recently shuffled)
-        shuffle_cards = view.get_cards_of_type(SHUFFLE)
-        if shuffle_cards and ek_risk >= 0.50 and self._turn_count > self._last_shuffle_turn + 1:
+        if self._hand_mask & SHUFFLE_BIT and ek_risk >= 0.50 and self._turn_count > self._last_shuffle_turn + 1:
             view.say("Critical shuffle!")
             self._last_shuffle_turn = self._turn_count
-            return PlayCardAction(card=shuffle_cards[0])
+            return PlayCardAction(card=self._hand_by_type[SHUFFLE][0])
         
         # Priority 5: Steal from players with few cards (high Defuse chance)
-        if view.other_players:
-            weak_targets = [
-                pid for pid in view.other_players
-                if view.other_player_card_counts.get(pid, 0) <= 2
-            ]
+        if others:
+            weak_targets = [pid for pid, _ in self._opponents_with_at_most(2)]
             if weak_targets:
                 combo_action = self._try_combo_against_targets(view, weak_targets)
                 if combo_action:
@@ -336,10 +444,9 @@ class MastermindBot(Bot):
         
         # Priority 7: Information gathering (if we have STF and no info)
         if not self._known_top_cards:
-            stf_cards = view.get_cards_of_type(STF)
-            if stf_cards and view.draw_pile_count > 0:
+            if self._hand_mask & STF_BIT and draw_n > 0:
                 view.say("Last chance intel.")
-                return PlayCardAction(card=stf_cards[0])
+                return PlayCardAction(card=self._hand_by_type[STF][0])
         
         # Default: draw (we've exhausted options)
         return DrawCardAction()
@@ -351,25 +458,22 @@ class MastermindBot(Bot):
     def _avoid_ek_on_top(self, view: BotView) -> Action:
         """Avoid drawing when EK is known to be on top."""
         # Try Skip first (safest)
-        skip_cards = view.get_cards_of_type(SKIP)
-        if skip_cards:
+        if self._hand_mask & SKIP_BIT:
             view.say("Dodging danger!")
-            return PlayCardAction(card=skip_cards[0])
+            return PlayCardAction(card=self._hand_by_type[SKIP][0])
         
         # Try Shuffle to reset
-        shuffle_cards = view.get_cards_of_type(SHUFFLE)
-        if shuffle_cards:
+        if self._hand_mask & SHUFFLE_BIT:
             view.say("Emergency shuffle!")
             self._last_shuffle_turn = self._turn_count
-            return PlayCardAction(card=shuffle_cards[0])
+            return PlayCardAction(card=self._hand_by_type[SHUFFLE][0])
         
         # Try Attack to pass turns (risky but better than drawing EK)
-        attack_cards = view.get_cards_of_type(ATTACK)
-        if attack_cards and view.other_players:
+        if self._hand_mask & ATTACK_BIT and view.other_players:
             target = self._choose_best_target(view, prefer_weak=True)
             if target:
                 view.say("Passing the risk...")
-                return PlayCardAction(card=attack_cards[0], target_player_id=target)
+                return PlayCardAction(card=self._hand_by_type[ATTACK][0], target_player_id=target)
         
         # No options - must draw (unlucky)
         return DrawCardAction()
@@ -383,24 +487,19 @@ class MastermindBot(Bot):
         2. Two-of-a-kind (random steal, still valuable)
         3. Five-different (only if discard has premium card)
         """
-        if not view.other_players:
+        others = view.other_players
+        hand = view.my_hand
+        if not others:
             return None
         
-        combos = self._find_all_combos(view.my_hand)
+        combos = self._cached_combos(hand)
         if not combos:
             return None
         
-        # Find valid targets
-        valid_targets = [
-            pid for pid in view.other_players
-            if view.other_player_card_counts.get(pid, 0) > 0
-        ]
-        if not valid_targets:
-            return None
-        
+        # Need at least one target with cards
         target = self._choose_best_target(view, prefer_weak=False)
         if not target:
-            target = valid_targets[0]
+            return None
         
         # Priority: three-of-a-kind > two-of-a-kind > five-different
         for combo_type, cards in combos:
@@ -414,12 +513,13 @@ class MastermindBot(Bot):
                 return PlayComboAction(cards=cards, target_player_id=target)
         
         # Five-different only if discard has premium card
+        discard = view.discard_pile
+        if not discard or discard[-1].card_type not in PREMIUM_TYPES:
+            return None
         for combo_type, cards in combos:
             if combo_type == "five_different":
-                top_discard = view.discard_pile[-1] if view.discard_pile else None
-                if top_discard and top_discard.card_type in (DEFUSE, NOPE, SHUFFLE, STF):
-                    view.say("Premium recovery!")
-                    return PlayComboAction(cards=cards)
+                view.say("Premium recovery!")
+                return PlayComboAction(cards=cards)
         
         return None
     
@@ -430,6 +530,7 @@ class MastermindBot(Bot):
         Strategy: Prefer targeting players with few cards (high chance of Defuse).
         Goal is often to deplete opponents, not just get valuable cards.
         """
+        hand = view.my_hand
         if not view.other_players:
             return None
         
@@ -439,28 +540,23 @@ class MastermindBot(Bot):
             return combo_action
         
         # Use Favor if we have it and target has cards
-        favor_cards = view.get_cards_of_type(FAVOR)
-        if not favor_cards:
+        if not self._hand_mask & FAVOR_BIT:
             return None
         
-        valid_targets = [
-            pid for pid in view.other_players
-            if view.other_player_card_counts.get(pid, 0) > 0
-        ]
+        valid_targets = self._opp_with_cards
         if not valid_targets:
             return None
         
         # Prefer targeting players with few cards (high Defuse chance)
-        weak_targets = [pid for pid in valid_targets if view.other_player_card_counts.get(pid, 0) <= 3]
-        if weak_targets:
-            target = min(weak_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+        if valid_targets[0][1] <= 3:
+            target, target_cards = valid_targets[0]
         else:
             # Fallback: target player with most cards
-            target = max(valid_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+            target = self._most_cards_target()
+            target_cards = valid_targets[-1][1]
         
         # Steal if: high risk, low cards, or opponent has significantly more
-        my_cards = len(view.my_hand)
-        target_cards = view.other_player_card_counts.get(target, 0)
+        my_cards = len(hand)
         
         should_steal = (
             ek_risk >= 0.30 or
@@ -471,7 +567,7 @@ class MastermindBot(Bot):
         
         if should_steal:
             view.say("Depleting opponent.")
-            return PlayCardAction(card=favor_cards[0], target_player_id=target)
+            return PlayCardAction(card=self._hand_by_type[FAVOR][0], target_player_id=target)
         
         return None
     
@@ -482,22 +578,22 @@ class MastermindBot(Bot):
         Strategy: Skip is safest (no retaliation). Only use Attack if we have
         multiple and can target weak opponent. Save these cards for when EK is imminent.
         """
+        others = view.other_players
+        draw_n = view.draw_pile_count
         # Skip is safest (no retaliation, ends turn)
-        skip_cards = view.get_cards_of_type(SKIP)
-        if skip_cards:
+        if self._hand_mask & SKIP_BIT:
             view.say("Avoiding the draw.")
-            return PlayCardAction(card=skip_cards[0])
+            return PlayCardAction(card=self._hand_by_type[SKIP][0])
         
         # Attack only if we have multiple and opponent likely lacks defense
         # In late game with thin deck, Attack can force multiple dangerous draws
-        attack_cards = view.get_cards_of_type(ATTACK)
-        if attack_cards and view.other_players:
-            target = self._choose_weakest_target(view)
+        if self._hand_mask & ATTACK_BIT and others:
+            target = self._choose_weakest_target()
             if target:
                 # Use Attack if deck is thin (forces multiple draws) or opponent is weak
-                if view.draw_pile_count <= 15 or self._opponent_defense_prob.get(target, 0.5) < 0.4:
+                if draw_n <= 15 or self._opponent_defense_prob.get(target, 0.5) < 0.4:
                     view.say("Defensive attack - passing risk.")
-                    return PlayCardAction(card=attack_cards[0], target_player_id=target)
+                    return PlayCardAction(card=self._hand_by_type[ATTACK][0], target_player_id=target)
         
         return None
     
@@ -509,12 +605,11 @@ class MastermindBot(Bot):
             return steal_action
         
         # Attack weakest opponent (likely to lack defense)
-        attack_cards = view.get_cards_of_type(ATTACK)
-        if attack_cards and view.other_players:
+        if self._hand_mask & ATTACK_BIT and view.other_players:
             target = self._choose_best_target(view, prefer_weak=True)
             if target:
                 view.say("Applying pressure.")
-                return PlayCardAction(card=attack_cards[0], target_player_id=target)
+                return PlayCardAction(card=self._hand_by_type[ATTACK][0], target_player_id=target)
         
         return None
     
@@ -526,8 +621,52 @@ class MastermindBot(Bot):
         """Update internal game state tracking."""
         if self._initial_player_count is None:
             self._initial_player_count = len(view.turn_order)
-        
-        self._my_defuses = view.count_cards_of_type(DEFUSE)
+            # Midgame while alive >= 60% of the table: integer ceil(0.6 * n)
+            self._mid_threshold = (3 * self._initial_player_count + 4) // 5
+        
+        self._my_defuses = len(self._cards_of_type(DEFUSE))
+        
+        # Opponents sorted by card count, snapshotted once so target selection
+        # doesn't re-run dict lookups inside min()/max() key functions. The sort
+        # is stable, so ties keep turn order just like min()/max() did.
+        counts = view.other_player_card_counts
+        self._opp_by_count = sorted(
+            ((pid, counts.get(pid, 0)) for pid in view.other_players),
+            key=lambda entry: entry[1],
+        )
+        self._opp_counts = [count for _, count in self._opp_by_count]
+        self._opp_with_cards = self._opp_by_count[bisect_right(self._opp_counts, 0):]
+        self._weakest_target = self._resolve_weakest_target()
+    
+    def _opponents_with_at_most(self, max_cards: int) -> list[tuple[str, int]]:
+        """Opponents holding <= max_cards, as a prefix of the sorted snapshot."""
+        return self._opp_by_count[:bisect_right(self._opp_counts, max_cards)]
+    
+    def _most_cards_target(self) -> str | None:
+        """First player (in turn order) among those holding the most cards."""
+        valid_targets = self._opp_with_cards
+        if not valid_targets:
+            return None
+        most = valid_targets[-1][1]
+        for pid, count in valid_targets:
+            if count == most:
+                return pid
+        return None
+    
+    def _index_hand(self, view: BotView) -> None:
+        """Group the hand by card type once (per take_turn/react) so helpers don't rescan it."""
+        by_type: dict[str, list[Card]] = {}
+        for card in view.my_hand:
+            by_type.setdefault(card.card_type, []).append(card)
+        self._hand_by_type = by_type
+        mask = 0
+        for card_type in by_type:
+            mask |= TYPE_BITS.get(card_type, 0)
+        self._hand_mask = mask
+    
+    def _cards_of_type(self, card_type: str) -> Sequence[Card]:
+        """Cards of a type from this turn's hand index (empty if none)."""
+        return self._hand_by_type.get(card_type, ())
     
     def _update_game_phase(self, view: BotView) -> None:
         """Determine current game phase."""
@@ -536,73 +675,56 @@ class MastermindBot(Bot):
         
         if alive_players == total_players:
             self._game_phase = "early"
-        elif alive_players >= total_players * 0.6:
+        elif alive_players >= self._mid_threshold:
             self._game_phase = "mid"
         else:
             self._game_phase = "late"
     
     def _choose_best_target(self, view: BotView, prefer_weak: bool = False) -> str | None:
         """Choose best target based on strategy."""
-        if not view.other_players:
-            return None
-        
-        valid_targets = [
-            pid for pid in view.other_players
-            if view.other_player_card_counts.get(pid, 0) > 0
-        ]
+        valid_targets = self._opp_with_cards
         if not valid_targets:
             return None
         
         if prefer_weak:
-            # Target weakest (fewest cards, lowest defense probability)
+            # Target weakest (fewest cards, then lowest defense probability)
+            fewest = valid_targets[0][1]
             return min(
-                valid_targets,
-                key=lambda pid: (
-                    view.other_player_card_counts.get(pid, 0),
-                    self._opponent_defense_prob.get(pid, 0.5)
-                )
-            )
-        else:
-            # Target strongest (most cards, more valuable steals)
-            return max(
-                valid_targets,
-                key=lambda pid: view.other_player_card_counts.get(pid, 0)
+                (pid for pid, count in valid_targets if count == fewest),
+                key=lambda pid: self._opponent_defense_prob.get(pid, 0.5),
             )
+        # Target strongest (most cards, more valuable steals)
+        return self._most_cards_target()
     
-    def _choose_weakest_target(self, view: BotView) -> str | None:
-        """Choose weakest target (fewest cards, no defuse used)."""
-        if not view.other_players:
-            return None
-        
-        valid_targets = [
-            pid for pid in view.other_players
-            if view.other_player_card_counts.get(pid, 0) > 0
-        ]
+    def _choose_weakest_target(self) -> str | None:
+        """Choose weakest target (fewest cards, no defuse used); resolved per turn."""
+        return self._weakest_target
+    
+    def _resolve_weakest_target(self) -> str | None:
+        """Weakest opponent from the sorted snapshot, preferring ones with no defuse used."""
+        valid_targets = self._opp_with_cards
         if not valid_targets:
             return None
         
         # Prefer targets who haven't used defuse and have few cards
-        weak_candidates = [
-            pid for pid in valid_targets
-            if not self._opponent_defuses_used.get(pid, False)
-        ]
-        if weak_candidates:
-            return min(weak_candidates, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+        for pid, _ in valid_targets:
+            if not self._opponent_defuses_used.get(pid, False):
+                return pid
         
         # Fallback to any weak target
-        return min(valid_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+        return valid_targets[0][0]
     
     def _try_combo_against_targets(self, view: BotView, targets: list[str]) -> Action | None:
-        """Try to play combo against specific targets."""
+        """Try to play combo against specific targets (sorted by ascending card count)."""
         if not targets:
             return None
         
-        combos = self._find_all_combos(view.my_hand)
+        combos = self._cached_combos(view.my_hand)
         if not combos:
             return None
         
         # Choose weakest target from provided list
-        target = min(targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+        target = targets[0]
         
         # Priority: three-of-a-kind > two-of-a-kind
         for combo_type, cards in combos:
@@ -617,34 +739,56 @@ class MastermindBot(Bot):
         
         return None
     
+    def _cached_combos(self, hand: tuple[Card, ...]) -> list[tuple[str, tuple[Card, ...]]]:
+        """_find_all_combos memoized on the hand tuple's identity (reset every turn)."""
+        if self._combos_cache is not None and self._combos_cache[0] is hand:
+            return self._combos_cache[1]
+        combos = self._find_all_combos(hand)
+        self._combos_cache = (hand, combos)
+        return combos
+    
     def _find_all_combos(self, hand: tuple[Card, ...]) -> list[tuple[str, tuple[Card, ...]]]:
         """Find all possible combos in hand."""
-        combos: list[tuple[str, tuple[Card, ...]]] = []
+        # Every combo needs at least two cards
+        if len(hand) < 2:
+            return []
         combo_cards = [c for c in hand if c.can_combo()]
+        if len(combo_cards) < 2:
+            return []
+        combos: list[tuple[str, tuple[Card, ...]]] = []
         
-        if not combo_cards:
-            return combos
-        
-        # Group by type
-        by_type: dict[str, list[Card]] = {}
+        # Pass 1: count types (Counter keeps first-seen order)
+        counts: Counter[str] = Counter(c.card_type for c in combo_cards)
+        
+        # How many cards each type contributes: up to 3 for sets, and one
+        # representative for the first five types when five-different is possible.
+        # Singletons outside the five-different window get no bucket at all.
+        five_types: tuple[str, ...] = tuple(islice(counts, 5)) if len(counts) >= 5 else ()
+        wanted: dict[str, int] = {
+            card_type: min(count, 3)
+            for card_type, count in counts.items()
+            if count >= 2 or card_type in five_types
+        }
+        
+        # Pass 2: pick only the representative cards that are actually needed
+        picked: dict[str, list[Card]] = {}
         for card in combo_cards:
-            if card.card_type not in by_type:
-                by_type[card.card_type] = []
-            by_type[card.card_type].append(card)
+            limit = wanted.get(card.card_type, 0)
+            if limit:
+                bucket = picked.setdefault(card.card_type, [])
+                if len(bucket) < limit:
+                    bucket.append(card)
         
         # Find pairs and triplets
-        for card_type, cards_of_type in by_type.items():
-            if len(cards_of_type) >= 3:
-                combos.append(("three_of_a_kind", tuple(cards_of_type[:3])))
-            elif len(cards_of_type) >= 2:
-                combos.append(("two_of_a_kind", tuple(cards_of_type[:2])))
+        for card_type, count in counts.items():
+            if count >= 3:
+                combos.append(("three_of_a_kind", tuple(picked[card_type])))
+            elif count >= 2:
+                combos.append(("two_of_a_kind", tuple(picked[card_type])))
         
         # Find five different
-        if len(by_type) >= 5:
-            five_cards: list[Card] = []
-            for card_type in list(by_type.keys())[:5]:
-                five_cards.append(by_type[card_type][0])
-            combos.append(("five_different", tuple(five_cards)))
+        if five_types:
+            combos.append(("five_different", tuple(picked[card_type][0] for card_type in five_types)))
         
         return combos
     
@@ -653,77 +797,79 @@ class MastermindBot(Bot):
     # ========================================================================
     
     def on_event(self, event: GameEvent, view: BotView) -> None:
-        """Track game events for strategic decisions."""
-        if event.event_type == EventType.BOT_CHAT:
-            return
-        
-        # Track peeked cards
-        if event.event_type == EventType.CARDS_PEEKED and event.player_id == view.my_id:
-            card_types: Sequence[str] = tuple(event.data.get("card_types", ()))
-            self._known_top_cards = tuple(card_types)
+        """Track game events for strategic decisions (one table lookup per event)."""
+        handler = self._event_handlers.get(event.event_type)
+        if handler is not None:
+            handler(event, view)
+    
+    def _on_cards_peeked(self, event: GameEvent, view: BotView) -> None:
+        """Track peeked cards."""
+        if event.player_id == view.my_id:
+            card_types: Sequence[str] = tuple(sys.intern(str(t)) for t in event.data.get("card_types", ()))
+            self._known_top_cards = deque(card_types, maxlen=3)
+            self._peek_version += 1
             self._just_peeked = True
-        
-        # Reset peek info on shuffle or EK insertion
-        if event.event_type in (EventType.DECK_SHUFFLED, EventType.EXPLODING_KITTEN_INSERTED):
-            self._known_top_cards = None
-            self._deck_shuffled = True
-        
-        # Update peek info when cards are drawn
-        if event.event_type == EventType.CARD_DRAWN and self._known_top_cards:
-            self._known_top_cards = self._known_top_cards[1:] if len(self._known_top_cards) > 1 else None
+    
+    def _on_deck_reordered(self, event: GameEvent, view: BotView) -> None:
+        """Reset peek info on shuffle or EK insertion."""
+        self._known_top_cards = None
+        self._peek_version += 1
+        self._deck_shuffled = True
+    
+    def _on_card_drawn(self, event: GameEvent, view: BotView) -> None:
+        """Update peek info and the drawer's hand size."""
+        if self._known_top_cards:
+            self._known_top_cards.popleft()
+            if not self._known_top_cards:
+                self._known_top_cards = None
+            self._peek_version += 1
             self._just_peeked = False
-        
-        # Track first EK
-        if event.event_type == EventType.EXPLODING_KITTEN_DRAWN:
-            if not self._first_ek_seen:
-                self._first_ek_seen = True
-                self._deck_shuffled = False
-        
-        # Track eliminations (EK consumed)
-        if event.event_type == EventType.PLAYER_ELIMINATED:
-            self._kittens_removed += 1
-            self._deck_shuffled = True
-        
-        # Track opponent behavior
-        if event.event_type == EventType.CARD_PLAYED:
-            card_type = event.data.get("card_type", "")
-            player_id = event.player_id
-            if player_id and player_id != view.my_id and player_id in view.other_players:
-                self._opponent_card_history.setdefault(player_id, []).append(card_type)
-                self._opponent_card_counts[player_id][card_type] += 1
-                self._update_opponent_model(player_id)
-        
-        # Track defuse usage (critical for strategic placement)
-        if event.event_type == EventType.DEFUSE_USED:
-            player_id = event.player_id
-            if player_id:
-                self._opponent_defuses_used[player_id] = True
-                if player_id == view.my_id:
-                    self._defuses_used += 1
-        
-        # Track hand sizes (for identifying weak targets)
-        if event.event_type == EventType.CARD_PLAYED or event.event_type == EventType.CARD_DRAWN:
-            player_id = event.player_id
-            if player_id and player_id in view.other_players:
-                # Update last seen hand size (approximate)
-                card_count = view.other_player_card_counts.get(player_id, 0)
-                if card_count > 0:
-                    self._opponent_last_seen_hand_size[player_id] = card_count
-    
-    def _update_opponent_model(self, player_id: str) -> None:
-        """Update opponent behavior model."""
-        history = self._opponent_card_counts[player_id]
-        total = sum(history.values())
-        if total == 0:
-            return
-        
-        # Calculate defense probability
-        defensive_cards = history[SKIP] + history[ATTACK] + history[SHUFFLE] + history[DEFUSE]
-        self._opponent_defense_prob[player_id] = min(0.9, defensive_cards / max(1, total))
-        
-        # Calculate Nope probability
-        nope_count = history[NOPE]
-        self._opponent_nope_prob[player_id] = min(0.8, nope_count / max(1, total))
+        self._record_hand_size(event.player_id, view)
+    
+    def _on_exploding_kitten_drawn(self, event: GameEvent, view: BotView) -> None:
+        """Track first EK."""
+        if not self._first_ek_seen:
+            self._first_ek_seen = True
+            self._deck_shuffled = False
+    
+    def _on_player_eliminated(self, event: GameEvent, view: BotView) -> None:
+        """Track eliminations (EK consumed)."""
+        self._kittens_removed += 1
+        self._deck_shuffled = True
+    
+    def _on_card_played(self, event: GameEvent, view: BotView) -> None:
+        """Track opponent behavior and the player's hand size."""
+        player_id = event.player_id
+        if player_id and player_id != view.my_id and player_id in view.other_players:
+            # Only opponents' plays feed the model, so read the payload here
+            card_type = sys.intern(str(event.data.get("card_type", "")))
+            tally = self._opponent_play_tally[player_id]
+            tally[TALLY_PLAYS] += 1
+            if card_type in DEFENSIVE_TYPES:
+                tally[TALLY_DEFENSIVE] += 1
+            elif card_type == NOPE:
+                tally[TALLY_NOPE] += 1
+            # Behaviour model: share of defensive / Nope plays so far
+            total = tally[TALLY_PLAYS]
+            self._opponent_defense_prob[player_id] = min(0.9, tally[TALLY_DEFENSIVE] / total)
+            self._opponent_nope_prob[player_id] = min(0.8, tally[TALLY_NOPE] / total)
+        self._record_hand_size(player_id, view)
+    
+    def _on_defuse_used(self, event: GameEvent, view: BotView) -> None:
+        """Track defuse usage (critical for strategic placement)."""
+        player_id = event.player_id
+        if player_id:
+            self._opponent_defuses_used[player_id] = True
+            if player_id == view.my_id:
+                self._defuses_used += 1
+    
+    def _record_hand_size(self, player_id: str | None, view: BotView) -> None:
+        """Track hand sizes (for identifying weak targets)."""
+        if player_id and player_id in view.other_players:
+            # Update last seen hand size (approximate)
+            card_count = view.other_player_card_counts.get(player_id, 0)
+            if card_count > 0:
+                self._opponent_last_seen_hand_size[player_id] = card_count
     
     # ========================================================================
     # REACTIONS
@@ -731,36 +877,57 @@ class MastermindBot(Bot):
     
     def react(self, view: BotView, triggering_event: GameEvent) -> Action | None:
         """Decide whether to Nope an action."""
-        nope_cards = view.get_cards_of_type(NOPE)
+        # Only card and combo plays can warrant a Nope; skip everything else
+        # before touching the hand or the payload
+        event_type = triggering_event.event_type
+        if event_type not in _REACT_EVENT_TYPES:
+            return None
+        
+        # One pass over the hand serves both the Nope lookup and the handlers
+        self._index_hand(view)
+        nope_cards = self._cards_of_type(NOPE)
         if not nope_cards:
             return None
         
-        event_type = triggering_event.event_type
         event_data = triggering_event.data
         
-        # Always Nope attacks targeting us
-        if event_type == EventType.CARD_PLAYED:
-            card_type = event_data.get("card_type", "")
-            target_id = event_data.get("target_player_id")
-            
-            if card_type == ATTACK and target_id == view.my_id:
-                view.say("Nope! Not taking that.")
-                return PlayCardAction(card=nope_cards[0])
-            
-            # Nope favors if we have few cards or valuable cards
-            if card_type == FAVOR and target_id == view.my_id:
-                if len(view.my_hand) < 5 or view.has_card_type(DEFUSE):
-                    view.say("Nope! My cards are mine.")
-                    return PlayCardAction(card=nope_cards[0])
-        
-        # Nope combos targeting us
-        if event_type == EventType.COMBO_PLAYED:
-            combo_target = event_data.get("target_player_id")
-            if combo_target == view.my_id:
-                view.say("Nope! No stealing from me.")
+        # Dispatch on (event type, played card type); card type is None for
+        # anything other than a single card being played
+        card_type = (
+            sys.intern(str(event_data.get("card_type", ""))) if event_type == _EV_CARD_PLAYED else None
+        )
+        handler = self._react_handlers.get((event_type, card_type))
+        if handler is None:
+            # Conservative: save Nopes for critical moments
+            return None
+        return handler(view, event_data, nope_cards)
+    
+    def _react_to_attack(
+        self, view: BotView, event_data: dict[str, Any], nope_cards: Sequence[Card]
+    ) -> Action | None:
+        """Always Nope attacks targeting us."""
+        if event_data.get("target_player_id") == view.my_id:
+            view.say("Nope! Not taking that.")
+            return PlayCardAction(card=nope_cards[0])
+        return None
+    
+    def _react_to_favor(
+        self, view: BotView, event_data: dict[str, Any], nope_cards: Sequence[Card]
+    ) -> Action | None:
+        """Nope favors on us if we have few cards or valuable cards."""
+        if event_data.get("target_player_id") == view.my_id:
+            if len(view.my_hand) < 5 or DEFUSE in self._hand_by_type:
+                view.say("Nope! My cards are mine.")
                 return PlayCardAction(card=nope_cards[0])
-        
-        # Conservative: save Nopes for critical moments
+        return None
+    
+    def _react_to_combo(
+        self, view: BotView, event_data: dict[str, Any], nope_cards: Sequence[Card]
+    ) -> Action | None:
+        """Nope combos targeting us."""
+        if event_data.get("target_player_id") == view.my_id:
+            view.say("Nope! No stealing from me.")
+            return PlayCardAction(card=nope_cards[0])
         return None
     
     # ========================================================================
@@ -789,7 +956,7 @@ class MastermindBot(Bot):
         # If we have weak targets and deck is thin, place EK near top to target them
         if weak_targets and draw_pile_size <= 10:
             # Place in top 30% to force threat on next few players
-            max_pos = max(1, int(draw_pile_size * 0.3))
+            max_pos = max(1, (draw_pile_size * 3) // 10)
             return max(1, min(max_pos, draw_pile_size - 1))
         
         # Late game with thin deck: place closer to top (not position 0, but close)
@@ -797,16 +964,17 @@ class MastermindBot(Bot):
             # Place in positions 1-3 (forces threat soon)
             return max(1, min(3, draw_pile_size - 1))
         
-        # Mid game: avoid top 2 positions, avoid bottom
-        min_pos = max(2, draw_pile_size // 4)
-        max_pos = min(draw_pile_size - 2, int(draw_pile_size * 0.75))
-        
+        # Mid game: avoid top 2 positions, avoid bottom (second quarter to third quarter)
+        n = draw_pile_size
+        quarter = n >> 2
+        three_quarters = (3 * n) >> 2
+        min_pos = quarter if quarter > 2 else 2
+        max_pos = three_quarters if three_quarters < n - 2 else n - 2
         if max_pos < min_pos:
             max_pos = min_pos
         
-        # Prefer middle-upper range
-        position = (min_pos + max_pos) // 2
-        return max(min_pos, min(position, max_pos))
+        # Prefer middle-upper range; the midpoint is already within [min_pos, max_pos]
+        return (min_pos + max_pos) >> 1
     
     def choose_card_to_give(self, view: BotView, requester_id: str) -> Card:
         """
@@ -815,20 +983,19 @@ class MastermindBot(Bot):
         Strategy: Give least valuable card.
         Priority: Cat cards > expendable actions > last resort
         """
-        hand = list(view.my_hand)
-        
-        # Give cat cards first (least valuable)
-        cat_cards = [c for c in hand if "Cat" in c.card_type]
-        if cat_cards:
-            return cat_cards[0]
-        
-        # Give expendable action cards (not Defuse/Nope)
-        expendable = [
-            c for c in hand
-            if c.card_type not in (DEFUSE, NOPE, SHUFFLE, STF)
-        ]
-        if expendable:
-            return expendable[0]
+        hand = view.my_hand
+        
+        # One pass: the first cat card (least valuable) wins outright;
+        # otherwise remember the first expendable action card (not premium)
+        expendable: Card | None = None
+        for card in hand:
+            card_type = card.card_type
+            if card_type in CAT_TYPES:
+                return card
+            if expendable is None and card_type not in PREMIUM_TYPES:
+                expendable = card
+        if expendable is not None:
+            return expendable
         
         # Last resort: give something (must give a card)
         return hand[0]
@@ -12,6 +12,8 @@ Strategy based on probability and card management:
 """
 
 import random
+from collections import defaultdict
+from typing import Callable, ClassVar, Sequence
 
 from game.bots.base import (
     Action,
@@ -24,6 +26,56 @@ from game.bots.view import BotView
 from game.cards.base import Card
 from game.history import GameEvent, EventType
 
+# Cat cards: no effect alone, so they are the first to give away
+CAT_TYPES: frozenset[str] = frozenset((
+    "TacoCatCard",
+    "HairyPotatoCatCard",
+    "BeardCatCard",
+    "RainbowRalphingCatCard",
+    "CattermelonCard",
+))
+# Cards kept to hand over when only EKs seem to remain (Favor response)
+USELESS_WHEN_ONLY_EKS: frozenset[str] = frozenset(("ShuffleCard", "SeeTheFutureCard"))
+# Cards never handed over unless nothing else is left
+NEVER_GIVE: frozenset[str] = frozenset(("DefuseCard", "NopeCard"))
+
+# See the Future policy, checked in order: (min EK probability, min STF cards held).
+# 40%+: always peek; 33%+: peek if we hold 2+; 25%+: peek if we hold 3+ (very safe)
+STF_THRESHOLDS: tuple[tuple[float, int], ...] = ((0.40, 1), (0.33, 2), (0.25, 3))
+# Attack policy, checked in order: (min Attacks held, min target cards, min EK probability).
+# 3+ Attacks: chain onto a 6+ card opponent; 2+ Attacks: 4+ card opponent once risk is 40%+
+ATTACK_THRESHOLDS: tuple[tuple[int, int, float], ...] = ((3, 6, 0.0), (2, 4, 0.40))
+
+
+def _defuse_positions(draw_pile_size: int) -> tuple[int, ...]:
+    """
+    Positions TFTBot may put a defused Exploding Kitten back at.
+    
+    Never the top (position 0) unless forced, and deeper into the deck as it
+    grows so the next Skip doesn't land us (or the next player) on it.
+    """
+    if draw_pile_size <= 1:
+        # Only 1 card in deck: no choice but the top
+        return (0,)
+    if draw_pile_size == 2:
+        # Only 2 cards: put at position 1 (not top)
+        return (1,)
+    if draw_pile_size <= 5:
+        # Small deck: avoid top position (0), put at 1, 2, or 3
+        return tuple(range(1, min(3, draw_pile_size - 1) + 1))
+    if draw_pile_size <= 7:
+        # Medium deck: avoid top 2 positions (0 and 1)
+        return tuple(range(2, draw_pile_size))
+    # Larger deck: avoid top 3 positions (where Skip might put us),
+    # put it in positions 4 to 75% of deck
+    return tuple(range(4, max(5, (draw_pile_size * 3) >> 2) + 1))
+
+
+# Defuse positions for every pile size a standard game can reach
+DEFUSE_POSITIONS: dict[int, tuple[int, ...]] = {
+    size: _defuse_positions(size) for size in range(64)
+}
+
 
 class TFTBot(Bot):
     """
@@ -37,147 +89,158 @@ class TFTBot(Bot):
     - Aggressive: Steal from one target, use Skip to pass turn, save Attacks for end game
     """
     
+    __slots__ = (
+        "_first_ek_drawn", "_deck_shuffled", "_just_shuffled", "_ek_on_top",
+        "_ek_prob_cache", "_rng", "_pick", "_event_handlers",
+    )
+    
+    # =====================================================================
+    # CHAT PHRASES - Strategic bot personality (shared, immutable)
+    # =====================================================================
+    
+    # General turn phrases
+    _TURN_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Calculating my win condition...",
+        "Playing for late game.",
+        "This is a tempo play.",
+        "Thinking about my next spike...",
+        "I scale here.",
+        "Time to make a macro move.",
+        "Trust the process.",
+    )
+    
+    # Phrases when shuffling
+    _SHUFFLE_PHRASES: ClassVar[tuple[str, ...]] = (
+        "RNG diff incoming.",
+        "Rolling the dice again.",
+        "Resetting the lobby.",
+        "New patch, new odds.",
+        "Time to reroll.",
+    )
+    
+    # Phrases when using See the Future
+    _STF_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Scouting the lobby...",
+        "Checking future rounds...",
+        "Reading the meta...",
+        "Let me see the next fight...",
+        "Vision advantage secured.",
+    )
+    
+    # Phrases when stealing (Favor)
+    _STEAL_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Yoink.",
+        "That's my item now.",
+        "Thanks for the donation.",
+        "Skill issue, hand it over.",
+        "Tax collected.",
+    )
+    
+    # Phrases when playing Skip
+    _SKIP_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Playing safe this turn.",
+        "No need to overextend.",
+        "Slow rolling here.",
+        "Holding tempo.",
+        "We chill for now.",
+    )
+    
+    # Phrases when playing Attack
+    _ATTACK_PHRASES: ClassVar[tuple[str, ...]] = (
+        "All-in.",
+        "Hard forcing this.",
+        "Time to grief someone.",
+        "Full send.",
+        "Limit testing.",
+    )
+    
+    # Phrases when playing Nope
+    _NOPE_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Nope, cancelled.",
+        "Not allowed.",
+        "That doesn't go through.",
+        "Denied by game knowledge.",
+        "Counterplay exists.",
+    )
+    
+    # Phrases when defusing
+    _DEFUSE_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Survived the fight!",
+        "Clutched that round.",
+        "Still in the game.",
+        "Barely lived, but we take those.",
+        "Outplayed.",
+        "That was close, holy.",
+    )
+    
+    # Phrases when giving a card
+    _GIVE_CARD_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Fine, take it.",
+        "Unlucky trade.",
+        "Here, enjoy.",
+        "This better be worth it.",
+        "I'm griefing myself.",
+    )
+    
+    # Phrases when observing events
+    _REACTION_PHRASES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "elimination": (
+            "Player diff.",
+            "Lobby just got easier.",
+            "GG go next.",
+            "Outscaled.",
+        ),
+        "explosion": (
+            "RNG diff.",
+            "Unlucky.",
+            "That's tragic.",
+            "Not my problem.",
+        ),
+        "attack": (
+            "That's a grief.",
+            "Unlucky timing.",
+            "Hate to see that.",
+        ),
+    }
+    
+    # Last words when exploding
+    _EXPLOSION_PHRASES: ClassVar[tuple[str, ...]] = (
+        "Unlucky RNG, comp was correct.",
+        "I played for late and didn't make it.",
+        "Sometimes the game just says no.",
+        "Good build, bad rolls.",
+        "GG, see you next lobby.",
+        "The macro was right, the outcome wasn't.",
+    )
+    
     def __init__(self) -> None:
         """Initialize bot with strategy tracking."""
         # Track game state
         self._first_ek_drawn: bool = False
         self._deck_shuffled: bool = True  # Start shuffled (unknown EK position)
-        self._num_players: int = 0
-        self._num_eks_remaining: int = 0
-        
-        # Track opponent actions
-        self._opponent_card_history: dict[str, list[str]] = {}
-        
-        # Track our STF usage (can't see results, but track when we use it)
-        self._last_stf_step: int = -1
         
         # Track if we just shuffled (to avoid wasting Shuffle cards)
         self._just_shuffled: bool = False
         
-        # Track what we saw with See the Future (from CARDS_PEEKED events)
-        self._last_peeked_cards: list[str] = []  # Card types we saw
-        
         # Track if we know EK is on top (from STF)
         self._ek_on_top: bool = False
         
-        # =====================================================================
-        # CHAT PHRASES - Strategic bot personality
-        # =====================================================================
-        
-        # General turn phrases
-        self._turn_phrases: list[str] = [
-            "Calculating my win condition...",
-            "Playing for late game.",
-            "This is a tempo play.",
-            "Thinking about my next spike...",
-            "I scale here.",
-            "Time to make a macro move.",
-            "Trust the process.",
-        ]
-        
-        # Phrases when shuffling
-        self._shuffle_phrases: list[str] = [
-            "RNG diff incoming.",
-            "Rolling the dice again.",
-            "Resetting the lobby.",
-            "New patch, new odds.",
-            "Time to reroll.",
-        ]
-        
-        # Phrases when using See the Future
-        self._stf_phrases: list[str] = [
-            "Scouting the lobby...",
-            "Checking future rounds...",
-            "Reading the meta...",
-            "Let me see the next fight...",
-            "Vision advantage secured.",
-        ]
-        
-        # Phrases when stealing (Favor)
-        self._steal_phrases: list[str] = [
-            "Yoink.",
-            "That's my item now.",
-            "Thanks for the donation.",
-            "Skill issue, hand it over.",
-            "Tax collected.",
-        ]
-        
-        # Phrases when playing Skip
-        self._skip_phrases: list[str] = [
-            "Playing safe this turn.",
-            "No need to overextend.",
-            "Slow rolling here.",
-            "Holding tempo.",
-            "We chill for now.",
-        ]
-        
-        # Phrases when playing Attack
-        self._attack_phrases: list[str] = [
-            "All-in.",
-            "Hard forcing this.",
-            "Time to grief someone.",
-            "Full send.",
-            "Limit testing.",
-        ]
-        
-        # Phrases when playing Nope
-        self._nope_phrases: list[str] = [
-            "Nope, cancelled.",
-            "Not allowed.",
-            "That doesn't go through.",
-            "Denied by game knowledge.",
-            "Counterplay exists.",
-        ]
-        
-        # Phrases when defusing
-        self._defuse_phrases: list[str] = [
-            "Survived the fight!",
-            "Clutched that round.",
-            "Still in the game.",
-            "Barely lived, but we take those.",
-            "Outplayed.",
-            "That was close, holy.",
-        ]
-        
-        # Phrases when giving a card
-        self._give_card_phrases: list[str] = [
-            "Fine, take it.",
-            "Unlucky trade.",
-            "Here, enjoy.",
-            "This better be worth it.",
-            "I'm griefing myself.",
-        ]
-        
-        # Phrases when observing events
-        self._reaction_phrases: dict[str, list[str]] = {
-            "elimination": [
-                "Player diff.",
-                "Lobby just got easier.",
-                "GG go next.",
-                "Outscaled.",
-            ],
-            "explosion": [
-                "RNG diff.",
-                "Unlucky.",
-                "That's tragic.",
-                "Not my problem.",
-            ],
-            "attack": [
-                "That's a grief.",
-                "Unlucky timing.",
-                "Hate to see that.",
-            ],
+        # Last (draw pile count, alive players, EK probability) computed
+        self._ek_prob_cache: tuple[int, int, float] | None = None
+        
+        # Private RNG for chat and defuse placement; choice is pre-bound since
+        # nearly every handler picks a phrase
+        self._rng: random.Random = random.Random()
+        self._pick: Callable[[Sequence[str]], str] = self._rng.choice
+        
+        # One table lookup per event instead of an if-chain over event types
+        self._event_handlers: dict[EventType, Callable[[GameEvent, BotView], None]] = {
+            EventType.EXPLODING_KITTEN_DRAWN: self._on_ek_drawn,
+            EventType.DECK_SHUFFLED: self._on_shuffled,
+            EventType.CARDS_PEEKED: self._on_peeked,
+            EventType.PLAYER_ELIMINATED: self._on_eliminated,
+            EventType.CARD_PLAYED: self._on_card_played,
         }
-        
-        # Last words when exploding
-        self._explosion_phrases: list[str] = [
-            "Unlucky RNG, comp was correct.",
-            "I played for late and didn't make it.",
-            "Sometimes the game just says no.",
-            "Good build, bad rolls.",
-            "GG, see you next lobby.",
-            "The macro was right, the outcome wasn't.",
-        ]
     
     @property
     def name(self) -> str:
@@ -189,23 +252,25 @@ class TFTBot(Bot):
         Calculate the probability of drawing an Exploding Kitten.
         
         Returns: Probability as a float (0.0 to 1.0)
+        
+        Only depends on the draw pile size and the number of players alive,
+        so the last result is reused while those stay the same.
         """
-        if view.draw_pile_count == 0:
+        draw_pile_count = view.draw_pile_count
+        if draw_pile_count == 0:
             return 0.0
         
-        # More accurate: Track eliminations to estimate EKs remaining
-        # Start with (num_players - 1) EKs, subtract eliminations
         alive_players = len(view.other_players) + 1  # +1 for us
         
-        # If we tracked num_players at game start, use that
-        if self._num_players > 0:
-            eliminations = self._num_players - alive_players
-            estimated_eks = max(1, (self._num_players - 1) - eliminations)
-        else:
-            # Fallback: estimate based on current players
-            estimated_eks = max(1, alive_players - 1)
+        cache = self._ek_prob_cache
+        if cache is not None and cache[0] == draw_pile_count and cache[1] == alive_players:
+            return cache[2]
         
-        return estimated_eks / view.draw_pile_count
+        # Start with (num_players - 1) EKs and subtract one per elimination:
+        # that is always alive_players - 1
+        probability = max(1, alive_players - 1) / draw_pile_count
+        self._ek_prob_cache = (draw_pile_count, alive_players, probability)
+        return probability
     
     def _is_deck_shuffled(self, view: BotView) -> bool:
         """
@@ -231,45 +296,49 @@ class TFTBot(Bot):
         if view.my_turns_remaining == 1:
             self._just_shuffled = False
         
-        ek_probability = self._calculate_ek_probability(view)
-        is_shuffled = self._is_deck_shuffled(view)
-        
-        # Random chance to say something during turn (20% chance)
-        #if random.random() < 0.2:
-        view.say(random.choice(self._turn_phrases))
-        
         # =====================================================================
         # EARLY GAME: Before first EK drawn - JUST DRAW
         # =====================================================================
         if not self._first_ek_drawn:
             # 14% chance first player draws EK - acceptable risk
             # 80% chance someone else draws it first
-            # Don't waste cards, just amass them
+            # Don't waste cards, just amass them (and don't telegraph it)
             return DrawCardAction()
         
+        ek_probability = self._calculate_ek_probability(view)
+        is_shuffled = self._is_deck_shuffled(view)
+        
+        # Random chance to say something during turn (20% chance)
+        #if self._rng.random() < 0.2:
+        view.say(self._pick(self._TURN_PHRASES))
+        
         # =====================================================================
         # AFTER FIRST EK: Priority order strategy
         # =====================================================================
         
+        # Group the hand by card type once; the hand can't change mid-decision
+        cards_by_type: defaultdict[str, list[Card]] = defaultdict(list)
+        for card in view.my_hand:
+            cards_by_type[card.card_type].append(card)
+        
         # 1. PRIORITY: Shuffle (resets odds, best move)
         # But don't waste Shuffle cards - only shuffle once per turn cycle
-        shuffle_cards = view.get_cards_of_type("ShuffleCard")
+        shuffle_cards = cards_by_type.get("ShuffleCard", ())
         if shuffle_cards and view.draw_pile_count > 0 and not self._just_shuffled:
-            view.say(random.choice(self._shuffle_phrases))
+            view.say(self._pick(self._SHUFFLE_PHRASES))
             self._just_shuffled = True  # Mark that we shuffled
             return PlayCardAction(card=shuffle_cards[0])
         
         # 2. PRIORITY: If we know EK is on top, use Skip/Shuffle immediately
         if self._ek_on_top:
             # EK is on top - avoid drawing!
-            skip_cards = view.get_cards_of_type("SkipCard")
+            skip_cards = cards_by_type.get("SkipCard", ())
             if skip_cards:
                 view.say("Avoiding the top!")
                 self._ek_on_top = False  # Reset after using skip
                 return PlayCardAction(card=skip_cards[0])
             
             # No skip? Use shuffle to reset
-            shuffle_cards = view.get_cards_of_type("ShuffleCard")
             if shuffle_cards and view.draw_pile_count > 0:
                 view.say("Shuffling to avoid EK!")
                 self._ek_on_top = False
@@ -278,20 +347,13 @@ class TFTBot(Bot):
         
         # 3. PRIORITY: See the Future (great information)
         # Use based on probability thresholds
-        stf_cards = view.get_cards_of_type("SeeTheFutureCard")
+        stf_cards = cards_by_type.get("SeeTheFutureCard", ())
         if stf_cards and view.draw_pile_count > 0:
-            # At 40%+, always use STF (even if only one)
-            if ek_probability >= 0.40:
-                view.say(random.choice(self._stf_phrases))
-                return PlayCardAction(card=stf_cards[0])
-            # At 33%+, use STF if we have more than one
-            elif ek_probability >= 0.33 and len(stf_cards) > 1:
-                view.say(random.choice(self._stf_phrases))
-                return PlayCardAction(card=stf_cards[0])
-            # At 25%+, use STF if we have 3+ (very safe to use)
-            elif ek_probability >= 0.25 and len(stf_cards) >= 3:
-                view.say(random.choice(self._stf_phrases))
-                return PlayCardAction(card=stf_cards[0])
+            num_stf = len(stf_cards)
+            for min_probability, min_stf in STF_THRESHOLDS:
+                if ek_probability >= min_probability and num_stf >= min_stf:
+                    view.say(self._pick(self._STF_PHRASES))
+                    return PlayCardAction(card=stf_cards[0])
         
         # 4. PRIORITY: Play combos to steal valuable cards
         combos = self._find_possible_combos(view.my_hand)
@@ -299,125 +361,87 @@ class TFTBot(Bot):
             # Prefer three-of-a-kind (stronger - can name a card)
             for combo_type, combo_cards in combos:
                 if combo_type == "three_of_a_kind":
-                    valid_targets = [
-                        pid for pid in view.other_players
-                        if view.other_player_card_counts.get(pid, 0) > 0
-                    ]
-                    if valid_targets:
-                        target = max(valid_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
+                    target = self._pick_richest_target(view)
+                    if target is not None:
                         view.say("Combo time!")
                         return PlayComboAction(cards=combo_cards, target_player_id=target)
             
-            # Fall back to two-of-a-kind
-            combo_type, combo_cards = combos[0]
-            if combo_type in ("two_of_a_kind", "three_of_a_kind"):
-                valid_targets = [
-                    pid for pid in view.other_players
-                    if view.other_player_card_counts.get(pid, 0) > 0
-                ]
-                if valid_targets:
-                    target = max(valid_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
-                    return PlayComboAction(cards=combo_cards, target_player_id=target)
+            # Fall back to two-of-a-kind (the search only returns pairs and triples)
+            combo_cards = combos[0][1]
+            target = self._pick_richest_target(view)
+            if target is not None:
+                return PlayComboAction(cards=combo_cards, target_player_id=target)
         
         # 5. PRIORITY: Steal (Favor) - try to get Shuffle/STF/Defuse
         # Use when probability is getting high or we're low on cards
         # Also use if opponent has significantly more cards
-        favor_cards = view.get_cards_of_type("FavorCard")
-        if favor_cards:
+        # Favor state is shared with the aggressive-mode steal below
+        favor_card: Card | None = None
+        favor_target: str | None = None
+        favor_cards = cards_by_type.get("FavorCard", ())
+        if favor_cards and view.other_players:
             # Check if Favor can actually be played (targets must have cards)
-            playable_favors = [
-                card for card in favor_cards
-                if card.can_play(view, is_own_turn=True)
-            ]
-            if playable_favors and view.other_players:
-                # Find targets that actually have cards
-                valid_targets = [
-                    pid for pid in view.other_players
-                    if view.other_player_card_counts.get(pid, 0) > 0
-                ]
-                if valid_targets:
-                    # Target player with most cards (more likely to have Shuffle/STF)
-                    target = max(valid_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
-                    target_card_count = view.other_player_card_counts.get(target, 0)
-                    my_card_count = len(view.my_hand)
-                    
-                    # Steal if: high probability, low cards, or opponent has way more cards
-                    should_steal = (
-                        ek_probability >= 0.25 or 
-                        my_card_count < 5 or 
-                        (target_card_count >= my_card_count + 3)
-                    )
-                    
-                    if should_steal:
-                        view.say(random.choice(self._steal_phrases))
-                        return PlayCardAction(card=playable_favors[0], target_player_id=target)
+            favor_card = next(
+                (card for card in favor_cards if card.can_play(view, is_own_turn=True)), None
+            )
+            if favor_card is not None:
+                # Target player with most cards (more likely to have Shuffle/STF)
+                favor_target = self._pick_richest_target(view)
+        
+        if favor_card is not None and favor_target is not None:
+            target_card_count = view.other_player_card_counts.get(favor_target, 0)
+            my_card_count = len(view.my_hand)
+            
+            # Steal if: high probability, low cards, or opponent has way more cards
+            should_steal = (
+                ek_probability >= 0.25 or 
+                my_card_count < 5 or 
+                (target_card_count >= my_card_count + 3)
+            )
+            
+            if should_steal:
+                view.say(self._pick(self._STEAL_PHRASES))
+                return PlayCardAction(card=favor_card, target_player_id=favor_target)
         
         # 6. PRIORITY: Skip Cards (defensive or when under attack)
         # Use Skip (passive) when under attack or playing defensively
         if view.my_turns_remaining > 1:
-            skip_cards = view.get_cards_of_type("SkipCard")
+            skip_cards = cards_by_type.get("SkipCard", ())
             if skip_cards:
                 # Defensive mode: use Skip to pass turn
                 if ek_probability >= 0.50:
-                    view.say(random.choice(self._skip_phrases))
+                    view.say(self._pick(self._SKIP_PHRASES))
                     return PlayCardAction(card=skip_cards[0])
                 # Under attack: use Skip to end one turn
                 elif view.my_turns_remaining > 1:
-                    view.say(random.choice(self._skip_phrases))
+                    view.say(self._pick(self._SKIP_PHRASES))
                     return PlayCardAction(card=skip_cards[0])
         
         # 7. AGGRESSIVE MODE: At 50%+ probability, play aggressively
         if ek_probability >= 0.50:
-            # Try to steal from one target repeatedly
-            favor_cards = view.get_cards_of_type("FavorCard")
-            if favor_cards:
-                # Check if Favor can actually be played (targets must have cards)
-                playable_favors = [
-                    card for card in favor_cards
-                    if card.can_play(view, is_own_turn=True)
-                ]
-                if playable_favors and view.other_players:
-                    # Find targets that actually have cards
-                    valid_targets = [
-                        pid for pid in view.other_players
-                        if view.other_player_card_counts.get(pid, 0) > 0
-                    ]
-                    if valid_targets:
-                        # Target player with most cards
-                        target = max(valid_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
-                        view.say(random.choice(self._steal_phrases))
-                        return PlayCardAction(card=playable_favors[0], target_player_id=target)
+            # Try to steal from one target repeatedly (player with most cards)
+            if favor_card is not None and favor_target is not None:
+                view.say(self._pick(self._STEAL_PHRASES))
+                return PlayCardAction(card=favor_card, target_player_id=favor_target)
             
             # Use Skip to pass turn (prefer Skip over Attack to avoid retaliation)
-            skip_cards = view.get_cards_of_type("SkipCard")
+            skip_cards = cards_by_type.get("SkipCard", ())
             if skip_cards:
-                view.say(random.choice(self._skip_phrases))
+                view.say(self._pick(self._SKIP_PHRASES))
                 return PlayCardAction(card=skip_cards[0])
         
         # 8. END GAME: Save Attacks for when we have 3+ and opponent has many cards
         # Don't pass 7-turn attack to someone with 1 card and high EK chance
-        attack_cards = view.get_cards_of_type("AttackCard")
-        if attack_cards and len(attack_cards) >= 3 and view.other_players:
-            # Find opponent with 6+ cards (good target for attack chain)
-            good_targets = [
-                pid for pid in view.other_players
-                if view.other_player_card_counts.get(pid, 0) >= 6
-            ]
-            if good_targets:
-                target = max(good_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
-                view.say(random.choice(self._attack_phrases))
-                return PlayCardAction(card=attack_cards[0], target_player_id=target)
-        
         # 9. Use Attack if we have 2+ and opponent has 4+ cards (moderate aggression)
-        if attack_cards and len(attack_cards) >= 2 and view.other_players:
-            good_targets = [
-                pid for pid in view.other_players
-                if view.other_player_card_counts.get(pid, 0) >= 4
-            ]
-            if good_targets and ek_probability >= 0.40:
-                target = max(good_targets, key=lambda pid: view.other_player_card_counts.get(pid, 0))
-                view.say(random.choice(self._attack_phrases))
-                return PlayCardAction(card=attack_cards[0], target_player_id=target)
+        attack_cards = cards_by_type.get("AttackCard", ())
+        if attack_cards and view.other_players:
+            num_attacks = len(attack_cards)
+            for min_attacks, min_target_cards, min_probability in ATTACK_THRESHOLDS:
+                if num_attacks >= min_attacks and ek_probability >= min_probability:
+                    target = self._pick_richest_target(view, min_cards=min_target_cards)
+                    if target is not None:
+                        view.say(self._pick(self._ATTACK_PHRASES))
+                        return PlayCardAction(card=attack_cards[0], target_player_id=target)
         
         # =====================================================================
         # DEFAULT: Draw a card (if shuffled and probability < 33%, just draw)
@@ -429,44 +453,48 @@ class TFTBot(Bot):
         # Otherwise, we've exhausted our options - draw
         return DrawCardAction()
     
+    def _pick_richest_target(self, view: BotView, min_cards: int = 1) -> str | None:
+        """
+        Find the opponent holding the most cards, if any holds at least min_cards.
+        
+        Single pass over the opponents; ties go to the earliest player.
+        """
+        counts = view.other_player_card_counts
+        best_pid: str | None = None
+        best_n = min_cards - 1
+        for pid in view.other_players:
+            n = counts.get(pid, 0)
+            if n > best_n:
+                best_pid, best_n = pid, n
+        return best_pid
+    
     def _find_possible_combos(
         self, hand: tuple[Card, ...]
     ) -> list[tuple[str, tuple[Card, ...]]]:
         """
-        Find all possible combos in the given hand.
+        Find the combo take_turn would play from the given hand.
         
-        Returns: List of (combo_type, cards) tuples
+        Returns: A one-element list with the first three-of-a-kind, else the
+        first two-of-a-kind (in order of first appearance), else an empty list.
+        Five-different is never played by this bot, so it isn't looked for.
         """
-        combos: list[tuple[str, tuple[Card, ...]]] = []
-        
-        # Filter to only cards that can combo
-        combo_cards = [c for c in hand if c.can_combo()]
-        
-        if not combo_cards:
-            return combos
-        
-        # Group cards by type
-        by_type: dict[str, list[Card]] = {}
-        for card in combo_cards:
-            if card.card_type not in by_type:
-                by_type[card.card_type] = []
-            by_type[card.card_type].append(card)
-        
-        # Check for two-of-a-kind and three-of-a-kind
-        for card_type, cards_of_type in by_type.items():
+        # Group cards that can combo by type (single pass)
+        by_type: defaultdict[str, list[Card]] = defaultdict(list)
+        for card in hand:
+            if card.can_combo():
+                by_type[card.card_type].append(card)
+        
+        # Three-of-a-kind wins outright; remember the first pair as fallback
+        pair: tuple[Card, ...] | None = None
+        for cards_of_type in by_type.values():
             if len(cards_of_type) >= 3:
-                combos.append(("three_of_a_kind", tuple(cards_of_type[:3])))
-            elif len(cards_of_type) >= 2:
-                combos.append(("two_of_a_kind", tuple(cards_of_type[:2])))
-        
-        # Check for five different card types
-        if len(by_type) >= 5:
-            five_cards: list[Card] = []
-            for card_type in list(by_type.keys())[:5]:
-                five_cards.append(by_type[card_type][0])
-            combos.append(("five_different", tuple(five_cards)))
+                return [("three_of_a_kind", tuple(cards_of_type[:3]))]
+            if pair is None and len(cards_of_type) >= 2:
+                pair = tuple(cards_of_type[:2])
         
-        return combos
+        if pair is not None:
+            return [("two_of_a_kind", pair)]
+        return []
     
     def on_event(self, event: GameEvent, view: BotView) -> None:
         """
@@ -475,72 +503,69 @@ class TFTBot(Bot):
         Key tracking:
         - First EK drawn (triggers strategy change)
         - Deck shuffles (resets to shuffled state)
-        - Player eliminations (updates EK count estimate)
+        - Player eliminations (EK consumed, deck back to unknown state)
+        
+        Chat events have no handler, so we never respond to them (no loops).
         """
-        # Skip chat events to avoid infinite loops
-        if event.event_type == EventType.BOT_CHAT:
+        handler = self._event_handlers.get(event.event_type)
+        if handler is not None:
+            handler(event, view)
+    
+    def _on_ek_drawn(self, event: GameEvent, view: BotView) -> None:
+        """Track first EK drawn."""
+        if not self._first_ek_drawn:
+            self._first_ek_drawn = True
+            self._deck_shuffled = False  # EK position is now known (until shuffle)
+        # Comment on explosions (15% chance, if not us)
+        if self._rng.random() < 0.15 and event.player_id != view.my_id:
+            view.say(self._pick(self._REACTION_PHRASES["explosion"]))
+    
+    def _on_shuffled(self, event: GameEvent, view: BotView) -> None:
+        """Track deck shuffles (resets to shuffled/unknown state)."""
+        self._deck_shuffled = True
+        self._ek_on_top = False  # Reset EK tracking after shuffle
+        # Note: We don't reset _just_shuffled here because we want to prevent
+        # shuffling twice in the same multi-turn sequence. It resets when
+        # we start a new turn cycle (my_turns_remaining == 1)
+    
+    def _on_peeked(self, event: GameEvent, view: BotView) -> None:
+        """Note whether our See the Future showed an EK near the top."""
+        if event.player_id == view.my_id:
+            card_types = event.data.get("card_types", [])
+            # Check if EK is in the top 3 cards
+            if card_types and "ExplodingKittenCard" in card_types:
+                # Check if it's the first card (top of deck)
+                if card_types[0] == "ExplodingKittenCard":
+                    self._ek_on_top = True
+                # Or if it's in top 3 and probability is high, be cautious
+                else:
+                    # Calculate current EK probability
+                    current_ek_prob = self._calculate_ek_probability(view)
+                    if current_ek_prob >= 0.40:
+                        # EK is in top 3, be careful
+                        self._ek_on_top = True  # Conservative: treat as if on top
+    
+    def _on_eliminated(self, event: GameEvent, view: BotView) -> None:
+        """Track player eliminations."""
+        # EK was drawn and not defused - deck is now shuffled state
+        self._deck_shuffled = True
+        # Comment on eliminations (15% chance)
+        if self._rng.random() < 0.15 and event.player_id != view.my_id:
+            view.say(self._pick(self._REACTION_PHRASES["elimination"]))
+    
+    def _on_card_played(self, event: GameEvent, view: BotView) -> None:
+        """React to cards played by opponents (only their Attacks matter)."""
+        # Most plays aren't Attacks: test the card type before anything else
+        if event.data.get("card_type") != "AttackCard":
             return
-        
-        # Track first EK drawn
-        if event.event_type == EventType.EXPLODING_KITTEN_DRAWN:
-            if not self._first_ek_drawn:
-                self._first_ek_drawn = True
-                self._deck_shuffled = False  # EK position is now known (until shuffle)
-            # Comment on explosions (15% chance, if not us)
-            if random.random() < 0.15 and event.player_id != view.my_id:
-                view.say(random.choice(self._reaction_phrases["explosion"]))
-        
-        # Track deck shuffles (resets to shuffled/unknown state)
-        if event.event_type == EventType.DECK_SHUFFLED:
-            self._deck_shuffled = True
-            self._ek_on_top = False  # Reset EK tracking after shuffle
-            # Note: We don't reset _just_shuffled here because we want to prevent
-            # shuffling twice in the same multi-turn sequence. It resets when
-            # we start a new turn cycle (my_turns_remaining == 1)
-        
-        # Track what we saw with See the Future
-        if event.event_type == EventType.CARDS_PEEKED:
-            if event.player_id == view.my_id:
-                card_types = event.data.get("card_types", [])
-                self._last_peeked_cards = card_types
-                # Check if EK is in the top 3 cards
-                if card_types and "ExplodingKittenCard" in card_types:
-                    # Check if it's the first card (top of deck)
-                    if card_types[0] == "ExplodingKittenCard":
-                        self._ek_on_top = True
-                    # Or if it's in top 3 and probability is high, be cautious
-                    else:
-                        # Calculate current EK probability
-                        current_ek_prob = self._calculate_ek_probability(view)
-                        if current_ek_prob >= 0.40:
-                            # EK is in top 3, be careful
-                            self._ek_on_top = True  # Conservative: treat as if on top
-        
-        # Track player eliminations (updates EK count estimate)
-        if event.event_type == EventType.PLAYER_ELIMINATED:
-            # EK was drawn and not defused - deck is now shuffled state
-            self._deck_shuffled = True
-            # Comment on eliminations (15% chance)
-            if random.random() < 0.15 and event.player_id != view.my_id:
-                view.say(random.choice(self._reaction_phrases["elimination"]))
-        
-        # Track cards played by opponents (for strategy)
-        if event.event_type == EventType.CARD_PLAYED:
-            player_id = event.player_id
-            if player_id != view.my_id and player_id in view.other_players:
-                card_type = event.data.get("card_type", "")
-                if player_id not in self._opponent_card_history:
-                    self._opponent_card_history[player_id] = []
-                self._opponent_card_history[player_id].append(card_type)
-                
-                # Comment on attacks (10% chance)
-                if card_type == "AttackCard" and random.random() < 0.1:
-                    view.say(random.choice(self._reaction_phrases["attack"]))
-        
-        # Track number of players (for EK count estimation)
-        if event.event_type == EventType.GAME_START:
-            self._num_players = len(view.other_players) + 1
-            self._num_eks_remaining = self._num_players - 1
+        player_id = event.player_id
+        # Comment on attacks (10% chance)
+        if (
+            player_id != view.my_id
+            and player_id in view.other_players
+            and self._rng.random() < 0.1
+        ):
+            view.say(self._pick(self._REACTION_PHRASES["attack"]))
     
     def react(self, view: BotView, triggering_event: GameEvent) -> Action | None:
         """
@@ -551,9 +576,10 @@ class TFTBot(Bot):
         - Favors targeting us (especially when we have valuable cards)
         - Combos that would steal from us
         """
-        nope_cards = view.get_cards_of_type("NopeCard")
-        
-        if not nope_cards:
+        # Only the first Nope is ever played: stop scanning at it, and bail out
+        # before any other work when we hold none (the common case)
+        nope_card = next((c for c in view.my_hand if c.card_type == "NopeCard"), None)
+        if nope_card is None:
             return None
         
         # Get the event type and data
@@ -561,27 +587,27 @@ class TFTBot(Bot):
         event_data = triggering_event.data
         
         # Always Nope attacks targeting us (high priority)
-        if event_type == EventType.CARD_PLAYED:
+        if event_type is EventType.CARD_PLAYED:
             card_type = event_data.get("card_type", "")
             target_id = event_data.get("target_player_id")
             
             if card_type == "AttackCard" and target_id == view.my_id:
-                view.say(random.choice(self._nope_phrases))
-                return PlayCardAction(card=nope_cards[0])
+                view.say(self._pick(self._NOPE_PHRASES))
+                return PlayCardAction(card=nope_card)
             
             # Nope favors targeting us (especially if we have few cards)
             if card_type == "FavorCard" and target_id == view.my_id:
                 # More likely to nope if we have few cards or valuable cards
                 if len(view.my_hand) < 5 or view.has_card_type("DefuseCard"):
-                    view.say(random.choice(self._nope_phrases))
-                    return PlayCardAction(card=nope_cards[0])
+                    view.say(self._pick(self._NOPE_PHRASES))
+                    return PlayCardAction(card=nope_card)
         
         # Nope combos targeting us
-        if event_type == EventType.COMBO_PLAYED:
+        if event_type is EventType.COMBO_PLAYED:
             combo_target = event_data.get("target_player_id")
             if combo_target == view.my_id:
-                view.say(random.choice(self._nope_phrases))
-                return PlayCardAction(card=nope_cards[0])
+                view.say(self._pick(self._NOPE_PHRASES))
+                return PlayCardAction(card=nope_card)
         
         # Be conservative - save Nopes for when we really need them
         return None
@@ -596,33 +622,13 @@ class TFTBot(Bot):
         - Don't want to accidentally end up where card is being drawn
         - Still trying to preserve cards, want to go back to playing odds
         """
-        view.say(random.choice(self._defuse_phrases))
-        
-        # Strategy: NEVER put at position 0 (top) unless absolutely forced
-        # Position 0 = next draw, which is too obvious
-        
-        if draw_pile_size <= 1:
-            # Edge case: only 1 card in deck, must put at position 0
-            # But this should rarely happen - if it does, we have no choice
-            return 0
-        elif draw_pile_size == 2:
-            # Only 2 cards: put at position 1 (not top)
-            return 1
-        elif draw_pile_size == 3:
-            # 3 cards: put at position 1 or 2 (avoid top)
-            return random.randint(1, 2)
-        elif draw_pile_size <= 5:
-            # Small deck: avoid top position (0), put at 1, 2, or 3
-            return random.randint(1, min(3, draw_pile_size - 1))
-        elif draw_pile_size <= 7:
-            # Medium deck: avoid top 2 positions (0 and 1)
-            return random.randint(2, draw_pile_size - 1)
-        else:
-            # Larger deck: avoid top 3 positions (where Skip might put us)
-            # Put it in positions 4 to 75% of deck
-            min_pos = 4
-            max_pos = max(min_pos + 1, int(draw_pile_size * 0.75))
-            return random.randint(min_pos, max_pos)
+        view.say(self._pick(self._DEFUSE_PHRASES))
+        
+        # Allowed positions per pile size are precomputed (see _defuse_positions)
+        positions = DEFUSE_POSITIONS.get(draw_pile_size)
+        if positions is None:
+            positions = _defuse_positions(draw_pile_size)
+        return self._rng.choice(positions)
     
     def choose_card_to_give(self, view: BotView, requester_id: str) -> Card:
         """
@@ -643,25 +649,25 @@ class TFTBot(Bot):
             # Keep Shuffle/STF as "useless" cards to give if stolen from
             useless_cards = [
                 c for c in hand
-                if c.card_type in ("ShuffleCard", "SeeTheFutureCard")
+                if c.card_type in USELESS_WHEN_ONLY_EKS
             ]
             if useless_cards and len(hand) > 3:
                 # Give useless card if we have other cards
                 return useless_cards[0]
         
         # Random chance to comment when giving a card (30% chance)
-        if random.random() < 0.3:
-            view.say(random.choice(self._give_card_phrases))
+        if self._rng.random() < 0.3:
+            view.say(self._pick(self._GIVE_CARD_PHRASES))
         
         # 1. Try to give a cat card (least valuable)
-        cat_cards = [c for c in hand if "Cat" in c.card_type]
+        cat_cards = [c for c in hand if c.card_type in CAT_TYPES]
         if cat_cards:
             return cat_cards[0]
         
         # 2. Give any action card that's not Defuse or Nope
         safe_to_give = [
             c for c in hand
-            if c.card_type not in ("DefuseCard", "NopeCard")
+            if c.card_type not in NEVER_GIVE
         ]
         if safe_to_give:
             return safe_to_give[0]
@@ -676,4 +682,4 @@ class TFTBot(Bot):
         Strategy note: You played the odds and lost. Take comfort that
         most of the time your risk would have paid off.
         """
-        view.say(random.choice(self._explosion_phrases))
+        view.say(self._pick(self._EXPLOSION_PHRASES))
@@ -5,9 +5,14 @@ These tests verify bot interface, BotView safety (anti-cheat),
 and dynamic bot loading.
 """
 
+import importlib.util
 import pytest
+import random
+import sys
 import tempfile
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 
 from game.bots.base import (
     Bot,
@@ -18,10 +23,80 @@ from game.bots.base import (
 from game.bots.view import BotView
 from game.bots.loader import BotLoader
 from game.cards.action_cards import SkipCard, NopeCard
-from game.cards.cat_cards import TacoCatCard
+from game.cards.base import Card
+from game.cards.cat_cards import (
+    BeardCatCard,
+    CattermelonCard,
+    HairyPotatoCatCard,
+    RainbowRalphingCatCard,
+    TacoCatCard,
+)
+from game.cards.exploding_kitten import DefuseCard
 from game.history import GameEvent, EventType
 
 
+# The shipped bots live outside the package, in the repo's bots/ directory
+BOTS_DIR: Path = Path(__file__).resolve().parent.parent / "bots"
+
+
+def load_bot_module(filename: str) -> ModuleType:
+    """Import one of the shipped bot files the same way BotLoader does."""
+    module_name: str = f"loaded_bot_{Path(filename).stem}"
+    spec = importlib.util.spec_from_file_location(module_name, BOTS_DIR / filename)
+    assert spec is not None and spec.loader is not None
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class FixedRandom(random.Random):
+    """Random stand-in whose random() always returns one value and counts its calls."""
+    
+    def __init__(self, value: float) -> None:
+        super().__init__()
+        self.value: float = value
+        self.calls: int = 0
+    
+    def random(self) -> float:
+        self.calls += 1
+        return self.value
+
+
+def create_event(event_type: EventType, player_id: str | None = None, **data: Any) -> GameEvent:
+    """Create a GameEvent for feeding a bot's on_event/react directly."""
+    return GameEvent(event_type=event_type, step=1, player_id=player_id, data=data)
+
+
+def create_view(
+    my_hand: tuple[Card, ...] = (),
+    other_player_card_counts: dict[str, int] | None = None,
+    turn_order: tuple[str, ...] | None = None,
+    my_id: str = "test_player",
+) -> BotView:
+    """Create a BotView for driving a bot directly, with other players from the counts."""
+    counts: dict[str, int] = (
+        other_player_card_counts
+        if other_player_card_counts is not None
+        else {"player2": 7, "player3": 5}
+    )
+    other_players: tuple[str, ...] = tuple(counts)
+    
+    return BotView(
+        my_id=my_id,
+        my_hand=my_hand,
+        my_turns_remaining=1,
+        discard_pile=(),
+        draw_pile_count=20,
+        other_players=other_players,
+        other_player_card_counts=counts,
+        current_player=my_id,
+        turn_order=turn_order if turn_order is not None else (my_id, *other_players),
+        is_my_turn=True,
+        recent_events=(),
+    )
+
+
 def create_test_view_with_cards() -> BotView:
     """Create a BotView with some cards in hand for testing."""
     skip_card = SkipCard()
@@ -244,3 +319,262 @@ class HiddenBot(Bot):
             bots = loader.load_from_directory(tmpdir)
             
             assert len(bots) == 0
+
+
+class TestMastermindBot:
+    """Tests for MastermindBot's event tracking (bots/mastermind_bot.py)."""
+    
+    def test_defuse_event_marks_opponent_and_retargets(self) -> None:
+        """An opponent's EXPLODING_KITTEN_DEFUSED is recorded and steers weakest-target picks."""
+        bot = load_bot_module("mastermind_bot.py").MastermindBot()
+        view: BotView = create_view(
+            my_hand=(DefuseCard(),),
+            other_player_card_counts={"player2": 2, "player3": 5},
+        )
+        
+        # Fewest cards wins while nobody has shown a Defuse
+        bot._index_hand(view)
+        bot._update_game_state(view)
+        assert bot._weakest_target == "player2"
+        
+        bot.on_event(
+            GameEvent(event_type=EventType.EXPLODING_KITTEN_DEFUSED, step=1, player_id="player2"),
+            view,
+        )
+        
+        assert bot._opponent_defuses_used["player2"] is True
+        assert bot._defuses_used == 0  # Only our own defuses count here
+        
+        # player2 has used a Defuse, so the next-weakest opponent is preferred
+        bot._update_game_state(view)
+        assert bot._weakest_target == "player3"
+    
+    def test_own_defuse_event_counts_towards_defuses_used(self) -> None:
+        """Our own EXPLODING_KITTEN_DEFUSED increments _defuses_used."""
+        bot = load_bot_module("mastermind_bot.py").MastermindBot()
+        view: BotView = create_view()
+        
+        bot.on_event(
+            GameEvent(event_type=EventType.EXPLODING_KITTEN_DEFUSED, step=1, player_id=view.my_id),
+            view,
+        )
+        
+        assert bot._defuses_used == 1
+
+    
+    @pytest.mark.parametrize("player_count", range(2, 11))
+    def test_game_phase_boundaries_match_float_threshold(self, player_count: int) -> None:
+        """The integer midgame threshold gives the same phase as alive >= 0.6 * n for every alive count."""
+        bot = load_bot_module("mastermind_bot.py").MastermindBot()
+        player_ids: tuple[str, ...] = tuple(f"player{i}" for i in range(1, player_count + 1))
+        table_view: BotView = create_view(
+            other_player_card_counts={pid: 5 for pid in player_ids[1:]},
+            turn_order=player_ids,
+            my_id=player_ids[0],
+        )
+        bot._update_game_state(table_view)
+        
+        for alive in range(1, player_count + 1):
+            view: BotView = create_view(
+                other_player_card_counts={pid: 5 for pid in player_ids[1:alive]},
+                turn_order=player_ids,
+                my_id=player_ids[0],
+            )
+            if alive == player_count:
+                expected: str = "early"
+            elif alive >= player_count * 0.6:
+                expected = "mid"
+            else:
+                expected = "late"
+            
+            bot._update_game_phase(view)
+            assert bot._game_phase == expected, f"{alive} of {player_count} alive"
+
+def _old_tft_defuse_bounds(draw_pile_size: int) -> tuple[int, int]:
+    """TFTBot's defuse placement ranges as (low, high), from before the position table."""
+    if draw_pile_size <= 1:
+        return 0, 0
+    if draw_pile_size == 2:
+        return 1, 1
+    if draw_pile_size <= 5:
+        return 1, min(3, draw_pile_size - 1)
+    if draw_pile_size <= 7:
+        return 2, draw_pile_size - 1
+    return 4, max(5, (3 * draw_pile_size) >> 2)
+
+
+class TestTFTBot:
+    """Tests for TFTBot's precomputed tables (bots/tft_bot.py)."""
+    
+    @pytest.mark.parametrize("draw_pile_size", range(0, 100))
+    def test_defuse_positions_match_old_ranges(self, draw_pile_size: int) -> None:
+        """Each pile size allows exactly the contiguous range the randint ladder drew from."""
+        tft = load_bot_module("tft_bot.py")
+        low, high = _old_tft_defuse_bounds(draw_pile_size)
+        expected: tuple[int, ...] = tuple(range(low, high + 1))
+        
+        assert tft._defuse_positions(draw_pile_size) == expected
+        if draw_pile_size in tft.DEFUSE_POSITIONS:
+            assert tft.DEFUSE_POSITIONS[draw_pile_size] == expected
+        else:
+            # Piles beyond the table fall back to computing the range
+            assert draw_pile_size >= 64
+    
+    @pytest.mark.parametrize("draw_pile_size", (1, 2, 4, 7, 40, 63, 64, 90))
+    def test_choose_defuse_position_stays_in_range(self, draw_pile_size: int) -> None:
+        """choose_defuse_position only returns allowed positions, table hit or fallback."""
+        bot = load_bot_module("tft_bot.py").TFTBot()
+        view: BotView = create_view()
+        low, high = _old_tft_defuse_bounds(draw_pile_size)
+        
+        for _ in range(50):
+            assert low <= bot.choose_defuse_position(view, draw_pile_size) <= high
+
+
+# Triggering events for aaron's react tests; the view's my_id is "test_player"
+ATTACK_ON_ME: GameEvent = create_event(
+    EventType.CARD_PLAYED, "player2", card_type="AttackCard", target_player_id="test_player"
+)
+ATTACK_ON_OTHER: GameEvent = create_event(
+    EventType.CARD_PLAYED, "player2", card_type="AttackCard", target_player_id="player3"
+)
+FAVOR_ON_ME: GameEvent = create_event(
+    EventType.CARD_PLAYED, "player2", card_type="FavorCard", target_player_id="test_player"
+)
+SKIP_PLAYED: GameEvent = create_event(EventType.CARD_PLAYED, "player2", card_type="SkipCard")
+FAVOR_REQUESTED_OF_ME: GameEvent = create_event(EventType.FAVOR_REQUESTED, "player2", target="test_player")
+FAVOR_REQUESTED_OF_OTHER: GameEvent = create_event(EventType.FAVOR_REQUESTED, "player2", target="player3")
+COMBO_ON_ME: GameEvent = create_event(EventType.COMBO_PLAYED, "player2", target_player_id="test_player")
+
+
+class TestAaronBot:
+    """Tests for aaron's MyBot event and reaction handling (bots/aaron_bot.py)."""
+    
+    def test_on_event_tracks_peeks_and_draws(self) -> None:
+        """Our own peek is remembered, draws consume it and a shuffle forgets it."""
+        bot = load_bot_module("aaron_bot.py").MyBot()
+        view: BotView = create_view()
+        peek_types: list[str] = ["SkipCard", "ExplodingKittenCard", "TacoCatCard"]
+        
+        # Someone else's peek tells us nothing
+        bot.on_event(create_event(EventType.CARDS_PEEKED, "player2", card_types=peek_types), view)
+        assert bot._known_top_cards is None
+        
+        bot.on_event(create_event(EventType.CARDS_PEEKED, view.my_id, card_types=peek_types), view)
+        assert list(bot._known_top_cards) == peek_types
+        
+        bot.on_event(create_event(EventType.CARD_DRAWN, "player2"), view)
+        assert list(bot._known_top_cards) == peek_types[1:]
+        
+        bot.on_event(create_event(EventType.DECK_SHUFFLED, "player3"), view)
+        assert bot._known_top_cards is None
+    
+    def test_on_event_tracks_opponents(self) -> None:
+        """Opponent plays, kittens and eliminations update the model; chat is ignored."""
+        bot = load_bot_module("aaron_bot.py").MyBot()
+        view: BotView = create_view()
+        
+        bot.on_event(create_event(EventType.CARD_PLAYED, "player2", card_type="SkipCard"), view)
+        bot.on_event(create_event(EventType.CARD_PLAYED, "player2", card_type="SkipCard"), view)
+        bot.on_event(create_event(EventType.CARD_PLAYED, view.my_id, card_type="SkipCard"), view)
+        assert bot._opponent_card_counts == {"player2": {"SkipCard": 2}}
+        
+        bot.on_event(create_event(EventType.EXPLODING_KITTEN_DRAWN, "player3"), view)
+        assert bot._first_ek_seen_from_other is True
+        
+        bot.on_event(create_event(EventType.PLAYER_ELIMINATED, "player3"), view)
+        assert bot._kittens_removed == 1
+        
+        bot.on_event(create_event(EventType.BOT_CHAT, "player2", message="hi"), view)
+        assert bot._opponent_card_counts == {"player2": {"SkipCard": 2}}
+        assert bot._kittens_removed == 1
+    
+    @pytest.mark.parametrize(
+        ("event", "nope_count", "roll", "expect_nope", "expect_rolls"),
+        [
+            # Attack or Favor on us: Nope straight away, without touching the RNG
+            (ATTACK_ON_ME, 1, 0.5, True, 0),
+            (FAVOR_ON_ME, 1, 0.5, True, 0),
+            # Aimed elsewhere: handler declines, so the 10% spare-Nope roll decides
+            (ATTACK_ON_OTHER, 2, 0.05, True, 1),
+            (ATTACK_ON_OTHER, 2, 0.5, False, 1),
+            # Unmapped card type: straight to the roll, which needs a spare Nope
+            (SKIP_PLAYED, 2, 0.05, True, 1),
+            (SKIP_PLAYED, 1, 0.05, False, 0),
+            # FAVOR_REQUESTED carries its target under "target"
+            (FAVOR_REQUESTED_OF_ME, 1, 0.5, True, 0),
+            (FAVOR_REQUESTED_OF_OTHER, 2, 0.5, False, 1),
+            # Events react doesn't map still get the roll
+            (COMBO_ON_ME, 2, 0.05, True, 1),
+            # No Nope in hand: nothing to do
+            (ATTACK_ON_ME, 0, 0.05, False, 0),
+        ],
+    )
+    def test_react_dispatch_and_spare_nope_roll(
+        self, event: GameEvent, nope_count: int, roll: float, expect_nope: bool, expect_rolls: int
+    ) -> None:
+        """react answers mapped threats first and otherwise falls through to the spare-Nope roll."""
+        bot = load_bot_module("aaron_bot.py").MyBot()
+        rng: FixedRandom = FixedRandom(roll)
+        bot._rng = rng
+        nopes: tuple[Card, ...] = tuple(NopeCard() for _ in range(nope_count))
+        view: BotView = create_view(my_hand=(*nopes, TacoCatCard()))
+        
+        action: Action | None = bot.react(view, event)
+        
+        if expect_nope:
+            assert isinstance(action, PlayCardAction)
+            assert action.card is nopes[0]
+        else:
+            assert action is None
+        assert rng.calls == expect_rolls
+    
+    @pytest.mark.parametrize(
+        ("shape", "expected"),
+        [
+            # Combos come out in the shape's (first-seen) order, not by strength
+            ((("TacoCatCard", 3), ("BeardCatCard", 2)),
+             (("three_of_a_kind", "TacoCatCard", 3), ("two_of_a_kind", "BeardCatCard", 2))),
+            ((("BeardCatCard", 2), ("TacoCatCard", 4)),
+             (("two_of_a_kind", "BeardCatCard", 2), ("three_of_a_kind", "TacoCatCard", 3))),
+            # Five-different needs five distinct types and is always listed last
+            ((("TacoCatCard", 1), ("BeardCatCard", 1), ("SkipCard", 1), ("FavorCard", 1)), ()),
+            ((("TacoCatCard", 2), ("BeardCatCard", 1), ("SkipCard", 1), ("FavorCard", 1), ("AttackCard", 1)),
+             (("two_of_a_kind", "TacoCatCard", 2), ("five_different", "", 5))),
+        ],
+    )
+    def test_combos_for_shape_order(
+        self, shape: tuple[tuple[str, int], ...], expected: tuple[tuple[str, str, int], ...]
+    ) -> None:
+        """The shared shape cache lists (combo_type, card_type, needed) in first-seen order."""
+        aaron = load_bot_module("aaron_bot.py")
+        
+        assert aaron._combos_for_shape(shape) == expected
+    
+    def test_find_possible_combos_matches_first_seen_grouping(self) -> None:
+        """Combos mapped back from the shape cache match a plain first-seen grouping of the hand."""
+        bot = load_bot_module("aaron_bot.py").MyBot()
+        hand: tuple[Card, ...] = (
+            BeardCatCard(), NopeCard(), TacoCatCard(), TacoCatCard(), DefuseCard(), BeardCatCard(),
+            TacoCatCard(), HairyPotatoCatCard(), RainbowRalphingCatCard(), CattermelonCard(),
+        )
+        
+        # Reference: group combo-able cards by type in first-seen order
+        groups: dict[str, list[Card]] = {}
+        for card in hand:
+            if card.can_combo():
+                groups.setdefault(card.card_type, []).append(card)
+        expected: list[tuple[str, tuple[Card, ...]]] = []
+        for cards in groups.values():
+            if len(cards) >= 3:
+                expected.append(("three_of_a_kind", tuple(cards[:3])))
+            elif len(cards) >= 2:
+                expected.append(("two_of_a_kind", tuple(cards[:2])))
+        expected.append(("five_different", tuple(cards[0] for cards in list(groups.values())[:5])))
+        
+        bot._build_hand_index(create_view(my_hand=hand))
+        combos = bot._find_possible_combos()
+        
+        assert combos == tuple(expected)
+        # _steal_for_value plays combos[0]: the Beard pair, seen before the Taco three
+        assert combos[0] == ("two_of_a_kind", (hand[0], hand[5]))